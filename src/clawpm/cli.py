@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import os
-import subprocess
+import re
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import NoReturn
 
 import click
 
-from . import __version__
+from . import __version__, jsonio
 from .models import (
     ProjectStatus,
     TaskState,
@@ -22,46 +24,31 @@ from .output import (
     OutputFormat,
     output_json,
     output_error,
+    output_static_error,
     output_success,
+    StaticError,
     output_projects_list,
     output_tasks_list,
     output_task_detail,
     output_worklog_entries,
+    output_worklog_batch,
     output_research_list,
     output_context,
 )
 from .discovery import (
+    DEFAULT_PORTFOLIO_ROOT,
     get_portfolio_path,
     load_portfolio_config,
     discover_projects,
     discover_untracked_repos,
     get_project,
     validate_portfolio,
+    probe_paths,
     init_project_from_repo,
     is_git_repo,
     path_for_config,
-)
-from .tasks import (
-    list_tasks,
-    get_task,
-    get_next_task,
-    change_task_state,
-    add_task,
-    edit_task,
-    split_task,
-    add_subtask,
-)
-from .worklog import (
-    add_entry,
-    tail_entries,
-    get_last_entry,
-    get_logged_commit_hashes,
-)
-from .research import (
-    list_research,
-    get_research,
-    add_research,
-    link_research_session,
+    record_project,
+    toml_string,
 )
 from .context import (
     resolve_project,
@@ -71,12 +58,88 @@ from .context import (
     detect_project_from_cwd,
     detect_untracked_repo_from_cwd,
     auto_init_if_untracked,
+    cwd_in_project_roots,
 )
 
 
 # Global format option
 pass_format = click.make_pass_decorator(OutputFormat, ensure=True)
 
+# Templates for the files written by 'project init'; settings values are
+# pre-quoted with toml_string()
+_SETTINGS_TEMPLATE = '''id = {id}
+name = {name}
+status = "active"
+priority = 5
+repo_path = {repo_path}
+labels = []
+'''
+
+_SPEC_TEMPLATE = """# {name}
+
+## Overview
+
+(Describe the project here)
+
+## Goals
+
+- Goal 1
+- Goal 2
+
+## Non-Goals
+
+- Non-goal 1
+
+## Technical Notes
+
+...
+"""
+
+_LEARNINGS_TEMPLATE = "# {name} Learnings\n\n"
+
+# Click choice values -> enum members, resolved without going through Enum.__call__
+_STATE_LOOKUP = {s.value: s for s in TaskState}
+_COMPLEXITY_LOOKUP = {c.value: c for c in TaskComplexity}
+_FORMAT_LOOKUP = {f.value: f for f in OutputFormat}
+
+# Choice types shared by several commands
+_COMPLEXITY_CHOICE = click.Choice(["s", "m", "l", "xl"])
+
+# States shown by 'tasks list' when no --state is given
+_DEFAULT_STATES = frozenset({TaskState.OPEN, TaskState.PROGRESS, TaskState.BLOCKED})
+
+# Errors with fixed messages, encoded once at import
+_ERR_PORTFOLIO_NOT_FOUND = StaticError(
+    "portfolio_not_found",
+    "No portfolio found at ~/clawpm (or CLAWPM_PORTFOLIO). Run setup or create portfolio.toml.",
+)
+_ERR_NO_PROJECT = StaticError(
+    "no_project",
+    "No project specified. Use --project, cd into a project, or run 'clawpm use <project>'.",
+)
+_ERR_NO_PROJECT_DETECTED = StaticError(
+    "no_project",
+    "No project specified or detected. Use -p or cd into a project.",
+)
+_ERR_NO_CHANGES = StaticError(
+    "no_changes",
+    "Specify at least one field to edit (--title, --priority, --complexity, --body)",
+)
+
+# Task ID (PROJ-NNN) referenced in a commit subject
+_COMMIT_TASK_ID_RE = re.compile(r"\b([A-Z]+-\d{3})\b")
+
+# Top-level "fixed": true in a raw issues.jsonl line
+_ISSUE_FIXED_RE = re.compile(rb'[{,]\s*"fixed"\s*:\s*true\s*[,}]')
+
+# Work log action recorded when a task moves to each state
+_STATE_TO_ACTION = {
+    TaskState.OPEN: WorkLogAction.NOTE,
+    TaskState.PROGRESS: WorkLogAction.START,
+    TaskState.DONE: WorkLogAction.DONE,
+    TaskState.BLOCKED: WorkLogAction.BLOCKED,
+}
+
 
 @click.group()
 @click.option(
@@ -95,7 +158,7 @@ pass_format = click.make_pass_decorator(OutputFormat, ensure=True)
 def main(ctx: click.Context, format: str, global_project: str | None) -> None:
     """ClawPM - Filesystem-first multi-project manager."""
     ctx.ensure_object(dict)
-    ctx.obj["format"] = OutputFormat(format)
+    ctx.obj["format"] = _FORMAT_LOOKUP[format]
     ctx.obj["global_project"] = global_project
 
 
@@ -104,20 +167,64 @@ def get_format(ctx: click.Context) -> OutputFormat:
     return ctx.obj.get("format", OutputFormat.JSON)
 
 
+def is_fixed_issue_line(line: bytes) -> bool:
+    """Tell from the raw bytes that an issue line is marked fixed, without parsing it.
+
+    Only flat records with a single "fixed" key qualify; a False result means
+    "parse it and check", not "open".
+    """
+    return (
+        line.count(b"{") == 1
+        and line.count(b'"fixed"') == 1
+        and _ISSUE_FIXED_RE.search(line) is not None
+    )
+
+
+def fail(ctx: click.Context, err: StaticError) -> NoReturn:
+    """Report a fixed-message error and exit with status 1."""
+    output_static_error(err, fmt=get_format(ctx))
+    sys.exit(1)
+
+
 def require_portfolio(ctx: click.Context):
-    """Load portfolio config or exit with error."""
+    """Load portfolio config or exit with error.
+
+    The config is stashed on ctx.obj so nested ctx.invoke() calls reuse it.
+    """
+    config = ctx.obj.get("portfolio_config")
+    if config is not None:
+        return config
     config = load_portfolio_config()
     if not config:
-        fmt = get_format(ctx)
-        output_error(
-            "portfolio_not_found",
-            "No portfolio found at ~/clawpm (or CLAWPM_PORTFOLIO). Run setup or create portfolio.toml.",
-            fmt=fmt,
-        )
-        sys.exit(1)
+        fail(ctx, _ERR_PORTFOLIO_NOT_FOUND)
+    ctx.obj["portfolio_config"] = config
     return config
 
 
+def discover_projects_cached(
+    ctx: click.Context,
+    config,
+    status_filter: ProjectStatus | None = None,
+):
+    """discover_projects() memoized on ctx.obj for the rest of this invocation."""
+    cache = ctx.obj.setdefault("discovered_projects", {})
+    if status_filter not in cache:
+        if None in cache:
+            # Filter the full scan in memory (it is already priority-sorted)
+            cache[status_filter] = [p for p in cache[None] if p.status == status_filter]
+        else:
+            cache[status_filter] = discover_projects(config, status_filter=status_filter)
+    return cache[status_filter]
+
+
+def get_project_cached(ctx: click.Context, config, project_id: str):
+    """get_project() memoized on ctx.obj for the rest of this invocation."""
+    cache = ctx.obj.setdefault("projects", {})
+    if project_id not in cache:
+        cache[project_id] = get_project(config, project_id)
+    return cache[project_id]
+
+
 def require_project(ctx: click.Context, project_id: str | None, required: bool = True, auto_init: bool = True) -> tuple[str | None, str]:
     """Resolve project from explicit arg, global flag, cwd, or context.
 
@@ -126,21 +233,39 @@ def require_project(ctx: click.Context, project_id: str | None, required: bool =
 
     If auto_init=True and cwd is in an untracked git repo under project_roots,
     automatically initializes a .project/ structure.
+
+    Implicit resolutions are stashed on ctx.obj so nested ctx.invoke() calls
+    skip the cwd walk.
     """
     # Check for global --project flag if no explicit arg
     if not project_id:
         project_id = ctx.obj.get("global_project")
         if project_id:
             return (project_id, "global")
+        if "resolved_project" in ctx.obj:
+            return ctx.obj["resolved_project"]
+
+    resolved_id, source = _resolve_project_uncached(ctx, project_id, auto_init)
+    if not project_id and resolved_id:
+        ctx.obj["resolved_project"] = (resolved_id, source)
 
+    if required and not resolved_id:
+        fail(ctx, _ERR_NO_PROJECT)
+
+    return resolved_id, source
+
+
+def _resolve_project_uncached(ctx: click.Context, project_id: str | None, auto_init: bool) -> tuple[str | None, str]:
+    """Resolve project from explicit arg, cwd, auto-init, or context."""
     resolved_id, source = resolve_project(project_id)
 
     # If no project found and auto_init enabled, check for untracked git repo
-    if not resolved_id and auto_init:
+    # (only possible when cwd is below a project root)
+    if not resolved_id and auto_init and cwd_in_project_roots(require_portfolio(ctx)):
         untracked_repo = detect_untracked_repo_from_cwd()
         if untracked_repo:
             # Auto-initialize the project
-            project = auto_init_if_untracked()
+            project = auto_init_if_untracked(require_portfolio(ctx))
             if project:
                 click.echo(f"Auto-initialized project '{project.id}' from git repo", err=True)
                 return (project.id, "auto-init")
@@ -151,15 +276,6 @@ def require_project(ctx: click.Context, project_id: str | None, required: bool =
         if fmt == OutputFormat.TEXT:
             click.echo(f"Using project: {resolved_id} (from {source})", err=True)
 
-    if required and not resolved_id:
-        fmt = get_format(ctx)
-        output_error(
-            "no_project",
-            "No project specified. Use --project, cd into a project, or run 'clawpm use <project>'.",
-            fmt=fmt,
-        )
-        sys.exit(1)
-
     return resolved_id, source
 
 
@@ -188,7 +304,7 @@ def use_project(ctx: click.Context, project_id: str | None, clear: bool) -> None
     
     if project_id:
         # Verify project exists
-        proj = get_project(config, project_id)
+        proj = get_project_cached(ctx, config, project_id)
         if not proj:
             output_error("project_not_found", f"Project '{project_id}' not found", fmt=fmt)
             sys.exit(1)
@@ -239,11 +355,13 @@ def projects() -> None:
 @click.pass_context
 def projects_list(ctx: click.Context, status_filter: str | None, show_all: bool) -> None:
     """List all projects (use --all to include untracked git repos)."""
+    from .tasks import count_tasks
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
     status = ProjectStatus(status_filter) if status_filter else None
-    projects_found = discover_projects(config, status_filter=status)
+    projects_found = discover_projects_cached(ctx, config, status_filter=status)
 
     if show_all or fmt == OutputFormat.JSON:
         untracked = discover_untracked_repos(config)
@@ -259,13 +377,10 @@ def projects_list(ctx: click.Context, status_filter: str | None, show_all: bool)
     else:
         # Collect task counts for text output
         task_counts = {}
+        wanted = (TaskState.OPEN, TaskState.PROGRESS, TaskState.BLOCKED)
         for proj in projects_found:
-            counts = {}
-            for state_name, state_val in [("open", TaskState.OPEN), ("progress", TaskState.PROGRESS), ("blocked", TaskState.BLOCKED)]:
-                count = len(list_tasks(config, proj.id, state_filter=state_val))
-                if count:
-                    counts[state_name] = count
-            task_counts[proj.id] = counts
+            counts = count_tasks(config, proj.id, states=wanted)
+            task_counts[proj.id] = {s.value: counts[s] for s in wanted if counts[s]}
 
         output_projects_list(projects_found, fmt=fmt, task_counts=task_counts)
 
@@ -280,22 +395,26 @@ def projects_list(ctx: click.Context, status_filter: str | None, show_all: bool)
 @click.pass_context
 def projects_next(ctx: click.Context) -> None:
     """Get the next task across all active projects."""
+    _do_projects_next(ctx)
+
+
+def _do_projects_next(ctx: click.Context) -> None:
+    """Body of 'projects next', shared with 'next' when no project is given."""
+    from .tasks import get_next_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
     # Get all active projects
-    active_projects = discover_projects(config, status_filter=ProjectStatus.ACTIVE)
-
-    # Find next task across all projects
-    best_task = None
-    best_project = None
-
-    for project in active_projects:
-        task = get_next_task(config, project.id)
-        if task:
-            if best_task is None or (project.priority, task.priority) < (best_project.priority, best_task.priority):
-                best_task = task
-                best_project = project
+    active_projects = discover_projects_cached(ctx, config, status_filter=ProjectStatus.ACTIVE)
+
+    # Find next task across all projects (min() keeps the first of equal ranks)
+    candidates = [(p, get_next_task(config, p.id)) for p in active_projects]
+    best_project, best_task = min(
+        ((project, task) for project, task in candidates if task),
+        key=lambda pt: (pt[0].priority, pt[1].priority),
+        default=(None, None),
+    )
 
     if best_task and best_project:
         result = {
@@ -360,51 +479,69 @@ def project_init(ctx: click.Context, repo_path: str, project_id: str | None, pro
     if not project_name:
         project_name = repo.name
 
-    # Create structure
     project_dir.mkdir(parents=True)
-    (project_dir / "tasks").mkdir()
-    (project_dir / "tasks" / "done").mkdir()
-    (project_dir / "tasks" / "blocked").mkdir()
-    (project_dir / "research").mkdir()
-    (project_dir / "notes").mkdir()
-
-    # Create settings.toml
-    repo_path_str = path_for_config(repo)
-    settings_content = f'''id = "{project_id}"
-name = "{project_name}"
-status = "active"
-priority = 5
-repo_path = "{repo_path_str}"
-labels = []
-'''
-    (project_dir / "settings.toml").write_text(settings_content)
-
-    # Create SPEC.md template
-    spec_content = f"""# {project_name}
-
-## Overview
-
-(Describe the project here)
-
-## Goals
+    for subdir in ("tasks", "tasks/done", "tasks/blocked", "research", "notes"):
+        (project_dir / subdir).mkdir()
+
+    # Write settings.toml, SPEC.md and learnings.md
+    fields = {"id": project_id, "name": project_name, "repo_path": path_for_config(repo)}
+    quoted = {key: toml_string(value) for key, value in fields.items()}
+    files = {
+        project_dir / "settings.toml": _SETTINGS_TEMPLATE.format_map(quoted).encode(),
+        project_dir / "SPEC.md": _SPEC_TEMPLATE.format_map(fields).encode(),
+        project_dir / "learnings.md": _LEARNINGS_TEMPLATE.format_map(fields).encode(),
+    }
+    for path, data in files.items():
+        path.write_bytes(data)
 
-- Goal 1
-- Goal 2
+    config = ctx.obj.get("portfolio_config") or load_portfolio_config()
+    if config:
+        record_project(config, project_id, repo)
 
-## Non-Goals
+    output_success(f"Project initialized at {project_dir}", fmt=fmt)
 
-- Non-goal 1
 
-## Technical Notes
+def _check_project(proj) -> list[dict]:
+    """Run the per-project doctor checks and return any issues found."""
+    issues: list[dict] = []
+    if not proj.project_dir:
+        return issues
 
-...
-"""
-    (project_dir / "SPEC.md").write_text(spec_content)
+    # One directory listing answers both .project/ membership checks
+    try:
+        with os.scandir(proj.project_dir / ".project") as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
 
-    # Create learnings.md
-    (project_dir / "learnings.md").write_text(f"# {project_name} Learnings\n\n")
+    # Check for required files
+    if "settings.toml" not in entries:
+        issues.append({
+            "level": "error",
+            "scope": "project",
+            "project": proj.id,
+            "message": "Missing settings.toml",
+        })
+
+    # Check tasks directory
+    if "tasks" not in entries:
+        issues.append({
+            "level": "warning",
+            "scope": "project",
+            "project": proj.id,
+            "message": "Missing tasks directory",
+        })
+
+    # Check for broken repo_path
+    if proj.repo_path and not proj.repo_path.exists():
+        issues.append({
+            "level": "warning",
+            "scope": "project",
+            "project": proj.id,
+            "message": f"repo_path does not exist: {proj.repo_path}",
+        })
 
-    output_success(f"Project initialized at {project_dir}", fmt=fmt)
+    return issues
 
 
 @project.command("doctor")
@@ -425,7 +562,7 @@ def project_doctor(ctx: click.Context, project_id: str | None) -> None:
     # Check projects
     projects_to_check = []
     if project_id:
-        proj = get_project(config, project_id)
+        proj = get_project_cached(ctx, config, project_id)
         if proj:
             projects_to_check = [proj]
         else:
@@ -436,41 +573,10 @@ def project_doctor(ctx: click.Context, project_id: str | None) -> None:
                 "message": f"Project not found: {project_id}",
             })
     else:
-        projects_to_check = discover_projects(config)
+        projects_to_check = discover_projects_cached(ctx, config)
 
     for proj in projects_to_check:
-        if not proj.project_dir:
-            continue
-
-        project_path = proj.project_dir / ".project"
-
-        # Check for required files
-        if not (project_path / "settings.toml").exists():
-            issues.append({
-                "level": "error",
-                "scope": "project",
-                "project": proj.id,
-                "message": "Missing settings.toml",
-            })
-
-        # Check tasks directory
-        tasks_dir = project_path / "tasks"
-        if not tasks_dir.exists():
-            issues.append({
-                "level": "warning",
-                "scope": "project",
-                "project": proj.id,
-                "message": "Missing tasks directory",
-            })
-
-        # Check for broken repo_path
-        if proj.repo_path and not proj.repo_path.exists():
-            issues.append({
-                "level": "warning",
-                "scope": "project",
-                "project": proj.id,
-                "message": f"repo_path does not exist: {proj.repo_path}",
-            })
+        issues.extend(_check_project(proj))
 
     if fmt == OutputFormat.JSON:
         output_json({"issues": issues, "count": len(issues)})
@@ -509,6 +615,8 @@ def tasks(ctx: click.Context) -> None:
 @click.pass_context
 def tasks_list(ctx: click.Context, project_id: str | None, state: str | None, flat: bool) -> None:
     """List tasks for a project (default: open+progress+blocked, use -s all for everything)."""
+    from .tasks import list_tasks
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
@@ -518,12 +626,9 @@ def tasks_list(ctx: click.Context, project_id: str | None, state: str | None, fl
         found_tasks = list_tasks(config, project_id, state_filter=None)
     elif state is None:
         # Default: show everything except done
-        found_tasks = []
-        for s in (TaskState.OPEN, TaskState.PROGRESS, TaskState.BLOCKED):
-            found_tasks.extend(list_tasks(config, project_id, state_filter=s))
-        found_tasks.sort(key=lambda t: (t.priority, t.id))
+        found_tasks = list_tasks(config, project_id, state_filter=_DEFAULT_STATES)
     else:
-        found_tasks = list_tasks(config, project_id, state_filter=TaskState(state))
+        found_tasks = list_tasks(config, project_id, state_filter=_STATE_LOOKUP[state])
 
     output_tasks_list(found_tasks, fmt=fmt, flat=flat)
 
@@ -534,6 +639,8 @@ def tasks_list(ctx: click.Context, project_id: str | None, state: str | None, fl
 @click.pass_context
 def tasks_show(ctx: click.Context, project_id: str | None, task_id: str) -> None:
     """Show details for a specific task."""
+    from .tasks import get_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -553,7 +660,7 @@ def tasks_show(ctx: click.Context, project_id: str | None, task_id: str) -> None
 @click.argument("task_id")
 @click.option("--title", "-t", help="New title")
 @click.option("--priority", type=int, help="New priority (1-10)")
-@click.option("--complexity", "-c", type=click.Choice(["s", "m", "l", "xl"]), help="New complexity")
+@click.option("--complexity", "-c", type=_COMPLEXITY_CHOICE, help="New complexity")
 @click.option("--body", "-b", help="New body content (replaces description before ## sections)")
 @click.pass_context
 def tasks_edit(
@@ -566,6 +673,8 @@ def tasks_edit(
     body: str | None,
 ) -> None:
     """Edit task metadata (title, priority, complexity, body)."""
+    from .tasks import edit_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
@@ -573,10 +682,9 @@ def tasks_edit(
     task_id = expand_task_id(task_id, project_id)
 
     if not any([title, priority is not None, complexity, body]):
-        output_error("no_changes", "Specify at least one field to edit (--title, --priority, --complexity, --body)", fmt=fmt)
-        sys.exit(1)
+        fail(ctx, _ERR_NO_CHANGES)
 
-    cmplx = TaskComplexity(complexity) if complexity else None
+    cmplx = _COMPLEXITY_LOOKUP[complexity] if complexity else None
 
     task = edit_task(
         config,
@@ -604,21 +712,31 @@ def tasks_edit(
 @click.pass_context
 def tasks_state(ctx: click.Context, project_id: str | None, task_id: str, new_state: str, note: str | None, force: bool) -> None:
     """Change task state."""
+    _do_state_change(ctx, project_id, task_id, new_state, note, force)
+
+
+def _do_state_change(ctx: click.Context, project_id: str | None, task_id: str, new_state: str, note: str | None, force: bool = False) -> None:
+    """Body of 'tasks state', shared with the done/start/block shortcuts."""
+    from .git import get_changed_files
+    from .tasks import get_task, get_tasks_bulk, change_task_state
+    from .worklog import add_entry
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
     project_id, _ = require_project(ctx, project_id)
     task_id = expand_task_id(task_id, project_id)
 
-    state = TaskState(new_state)
+    state = _STATE_LOOKUP[new_state]
     
     # Check for incomplete subtasks before attempting state change
     if state == TaskState.DONE and not force:
         task = get_task(config, project_id, task_id)
         if task and task.children:
+            children = get_tasks_bulk(config, project_id, task.children)
             incomplete = []
             for child_id in task.children:
-                child = get_task(config, project_id, child_id)
+                child = children.get(child_id)
                 if child and child.state != TaskState.DONE:
                     incomplete.append(f"{child_id} [{child.state.value}]")
             if incomplete:
@@ -636,35 +754,19 @@ def tasks_state(ctx: click.Context, project_id: str | None, task_id: str, new_st
         sys.exit(1)
 
     # Auto-log state change
-    action_map = {
-        TaskState.OPEN: WorkLogAction.NOTE,
-        TaskState.PROGRESS: WorkLogAction.START,
-        TaskState.DONE: WorkLogAction.DONE,
-        TaskState.BLOCKED: WorkLogAction.BLOCKED,
-    }
-    if state in action_map:
+    action = _STATE_TO_ACTION.get(state)
+    if action is not None:
         # Auto-detect git files changed
         files_changed = None
-        project = get_project(config, project_id)
+        project = get_project_cached(ctx, config, project_id)
         if project and project.repo_path and project.repo_path.exists():
-            try:
-                result = subprocess.run(
-                    ["git", "diff", "--name-only", "HEAD"],
-                    cwd=project.repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    files_changed = [f for f in result.stdout.strip().split('\n') if f]
-            except Exception:
-                pass
+            files_changed = get_changed_files(project.repo_path)
         
         summary = note if note else f"Task marked {new_state}"
         add_entry(
             config,
             project=project_id,
-            action=action_map[state],
+            action=action,
             task=task_id,
             summary=summary,
             files_changed=files_changed,
@@ -679,7 +781,7 @@ def tasks_state(ctx: click.Context, project_id: str | None, task_id: str, new_st
 @click.option("--title", "-t", required=True, help="Task title")
 @click.option("--id", "task_id", help="Task ID (auto-generated if not provided)")
 @click.option("--priority", type=int, default=5, help="Priority (1-10, lower is higher)")
-@click.option("--complexity", "-c", type=click.Choice(["s", "m", "l", "xl"]), help="Complexity")
+@click.option("--complexity", "-c", type=_COMPLEXITY_CHOICE, help="Complexity")
 @click.option("--depends", "-d", multiple=True, help="Dependencies (can specify multiple)")
 @click.option("--parent", "parent_id", help="Parent task ID (creates subtask)")
 @click.option("--description", help="Task description (deprecated, use --body)")
@@ -702,6 +804,26 @@ def tasks_add(
     read_stdin: bool,
 ) -> None:
     """Add a new task (or subtask with --parent)."""
+    _do_add_task(ctx, project_id, title, task_id, priority, complexity, depends, parent_id, description, body, body_file, read_stdin)
+
+
+def _do_add_task(
+    ctx: click.Context,
+    project_id: str | None,
+    title: str,
+    task_id: str | None = None,
+    priority: int = 5,
+    complexity: str | None = None,
+    depends: tuple[str, ...] = (),
+    parent_id: str | None = None,
+    description: str | None = None,
+    body: str | None = None,
+    body_file: str | None = None,
+    read_stdin: bool = False,
+) -> None:
+    """Body of 'tasks add', shared with the top-level add shortcut."""
+    from .tasks import add_task, add_subtask
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -718,7 +840,7 @@ def tasks_add(
     elif description:
         task_body = description
 
-    cmplx = TaskComplexity(complexity) if complexity else None
+    cmplx = _COMPLEXITY_LOOKUP[complexity] if complexity else None
 
     # Create subtask if parent specified
     if parent_id:
@@ -758,6 +880,8 @@ def tasks_add(
 @click.pass_context
 def tasks_split(ctx: click.Context, project_id: str | None, task_id: str) -> None:
     """Convert a task to a parent directory (for adding subtasks)."""
+    from .tasks import split_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -782,13 +906,13 @@ def tasks_split(ctx: click.Context, project_id: str | None, task_id: str) -> Non
 @click.option("--project", "-p", "project_id", help="Project ID (auto-detected if not specified)")
 @click.argument("title")
 @click.option("--priority", type=int, default=5, help="Priority (1-10)")
-@click.option("--complexity", "-c", type=click.Choice(["s", "m", "l", "xl"]), default="m", help="Complexity")
+@click.option("--complexity", "-c", type=_COMPLEXITY_CHOICE, default="m", help="Complexity")
 @click.option("--parent", "parent_id", help="Parent task ID (creates subtask)")
 @click.option("--body", "-b", help="Task description/body")
 @click.pass_context
 def quick_add(ctx: click.Context, project_id: str | None, title: str, priority: int, complexity: str, parent_id: str | None, body: str | None) -> None:
     """Quick add a task (alias for 'tasks add')."""
-    ctx.invoke(tasks_add, project_id=project_id, title=title, priority=priority, complexity=complexity, parent_id=parent_id, body=body)
+    _do_add_task(ctx, project_id, title, priority=priority, complexity=complexity, parent_id=parent_id, body=body)
 
 
 @main.command("done")
@@ -799,7 +923,7 @@ def quick_add(ctx: click.Context, project_id: str | None, title: str, priority:
 @click.pass_context
 def quick_done(ctx: click.Context, project_id: str | None, task_id: str, note: str | None, force: bool) -> None:
     """Mark a task as done (alias for 'tasks state <id> done')."""
-    ctx.invoke(tasks_state, project_id=project_id, task_id=task_id, new_state="done", note=note, force=force)
+    _do_state_change(ctx, project_id, task_id, "done", note, force)
 
 
 @main.command("start")
@@ -808,7 +932,7 @@ def quick_done(ctx: click.Context, project_id: str | None, task_id: str, note: s
 @click.pass_context
 def quick_start(ctx: click.Context, project_id: str | None, task_id: str) -> None:
     """Start working on a task (alias for 'tasks state <id> progress')."""
-    ctx.invoke(tasks_state, project_id=project_id, task_id=task_id, new_state="progress", note=None)
+    _do_state_change(ctx, project_id, task_id, "progress", None)
 
 
 @main.command("block")
@@ -818,7 +942,7 @@ def quick_start(ctx: click.Context, project_id: str | None, task_id: str) -> Non
 @click.pass_context
 def quick_block(ctx: click.Context, project_id: str | None, task_id: str, note: str | None) -> None:
     """Mark a task as blocked (alias for 'tasks state <id> blocked')."""
-    ctx.invoke(tasks_state, project_id=project_id, task_id=task_id, new_state="blocked", note=note)
+    _do_state_change(ctx, project_id, task_id, "blocked", note)
 
 
 @main.command("next")
@@ -826,6 +950,8 @@ def quick_block(ctx: click.Context, project_id: str | None, task_id: str, note:
 @click.pass_context
 def quick_next(ctx: click.Context, project_id: str | None) -> None:
     """Get the next task to work on."""
+    from .tasks import get_next_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -840,8 +966,7 @@ def quick_next(ctx: click.Context, project_id: str | None) -> None:
             else:
                 click.echo("No tasks available.")
     else:
-        # Delegate to projects next
-        ctx.invoke(projects_next)
+        _do_projects_next(ctx)
 
 
 @main.command("status")
@@ -849,6 +974,8 @@ def quick_next(ctx: click.Context, project_id: str | None) -> None:
 @click.pass_context
 def quick_status(ctx: click.Context, project_id: str | None) -> None:
     """Show current project status (tasks in progress, blockers, next up)."""
+    from .tasks import count_tasks, list_tasks, partition_tasks, select_next_task
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -856,7 +983,7 @@ def quick_status(ctx: click.Context, project_id: str | None) -> None:
     
     if not resolved_id:
         # Show overview of all projects
-        projects_found = discover_projects(config, status_filter=ProjectStatus.ACTIVE)
+        projects_found = discover_projects_cached(ctx, config, status_filter=ProjectStatus.ACTIVE)
         
         result = {
             "projects": [],
@@ -864,19 +991,19 @@ def quick_status(ctx: click.Context, project_id: str | None) -> None:
             "total_blocked": 0,
         }
         
-        for proj in projects_found:
-            in_progress = list_tasks(config, proj.id, state_filter=TaskState.PROGRESS)
-            blocked = list_tasks(config, proj.id, state_filter=TaskState.BLOCKED)
-            
+        # Only counts are shown, so tally file locations instead of parsing tasks
+        wanted = (TaskState.PROGRESS, TaskState.BLOCKED)
+        per_project = [count_tasks(config, proj.id, states=wanted) for proj in projects_found]
+        for proj, counts in zip(projects_found, per_project):
             proj_info = {
                 "id": proj.id,
                 "name": proj.name,
-                "in_progress": len(in_progress),
-                "blocked": len(blocked),
+                "in_progress": counts[TaskState.PROGRESS],
+                "blocked": counts[TaskState.BLOCKED],
             }
             result["projects"].append(proj_info)
-            result["total_active"] += len(in_progress)
-            result["total_blocked"] += len(blocked)
+            result["total_active"] += counts[TaskState.PROGRESS]
+            result["total_blocked"] += counts[TaskState.BLOCKED]
         
         if fmt == OutputFormat.JSON:
             output_json(result)
@@ -891,15 +1018,18 @@ def quick_status(ctx: click.Context, project_id: str | None) -> None:
                 click.echo(f"  {proj['name']}: {', '.join(status_str) if status_str else 'idle'}")
     else:
         # Show specific project status
-        proj = get_project(config, resolved_id)
+        proj = get_project_cached(ctx, config, resolved_id)
         if not proj:
             output_error("project_not_found", f"Project '{resolved_id}' not found", fmt=fmt)
             sys.exit(1)
         
-        in_progress = list_tasks(config, resolved_id, state_filter=TaskState.PROGRESS)
-        blocked = list_tasks(config, resolved_id, state_filter=TaskState.BLOCKED)
-        open_tasks = list_tasks(config, resolved_id, state_filter=TaskState.OPEN)
-        next_task = get_next_task(config, resolved_id)
+        # One scan serves the per-state lists and the next-task pick
+        all_tasks = list_tasks(config, resolved_id)
+        by_state = partition_tasks(all_tasks)
+        in_progress = by_state[TaskState.PROGRESS]
+        blocked = by_state[TaskState.BLOCKED]
+        open_tasks = by_state[TaskState.OPEN]
+        next_task = select_next_task(all_tasks)
         
         result = {
             "project": proj.id,
@@ -940,16 +1070,21 @@ def agent_context(ctx: click.Context, project_id: str | None, log_limit: int) ->
     
     Optimized for LLM agent consumption - everything needed to resume work.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .git import get_repo_summary
+    from .tasks import list_tasks, partition_tasks, select_next_task
+    from .worklog import tail_entries
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
     resolved_id, source = require_project(ctx, project_id, required=False)
     
     if not resolved_id:
-        output_error("no_project", "No project specified or detected. Use -p or cd into a project.", fmt=fmt)
-        sys.exit(1)
+        fail(ctx, _ERR_NO_PROJECT_DETECTED)
     
-    proj = get_project(config, resolved_id)
+    proj = get_project_cached(ctx, config, resolved_id)
     if not proj:
         output_error("project_not_found", f"Project '{resolved_id}' not found", fmt=fmt)
         sys.exit(1)
@@ -967,108 +1102,112 @@ def agent_context(ctx: click.Context, project_id: str | None, log_limit: int) ->
         "source": source,
     }
     
-    # Read spec if exists
-    if proj.project_dir:
-        spec_file = proj.project_dir / ".project" / "SPEC.md"
-        if spec_file.exists():
-            spec_content = spec_file.read_text()
-            # Truncate if too long
-            if len(spec_content) > 2000:
-                context["spec"] = spec_content[:2000] + "\n\n[...truncated...]"
-            else:
-                context["spec"] = spec_content
-    
+    def read_spec():
+        # Read one character past the limit; that is enough to know it was cut
+        try:
+            with open(proj.spec_file) as f:
+                spec_content = f.read(2001)
+        except FileNotFoundError:
+            return None
+        # Truncate if too long
+        if len(spec_content) > 2000:
+            return spec_content[:2000] + "\n\n[...truncated...]"
+        return spec_content
+
+    def read_git_summary():
+        # A missing repo_path fails to spawn git and yields no summary
+        try:
+            return get_repo_summary(proj.repo_path)
+        except Exception:
+            return {}
+
+    def read_open_issues():
+        # First 5 open issues in file order; stop reading once we have them
+        open_issues = []
+        try:
+            with open(proj.issues_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not is_fixed_issue_line(line):
+                        issue = jsonio.loads(line)
+                        if not issue.get("fixed"):
+                            open_issues.append({
+                                "type": issue.get("type"),
+                                "severity": issue.get("severity"),
+                                "summary": (issue.get("actual") or issue.get("context", ""))[:100],
+                            })
+                            if len(open_issues) == 5:
+                                break
+        except Exception:
+            pass  # Missing or unreadable issues file
+        return open_issues
+
+    # The git subprocesses dominate; overlap them and the file reads with the task scan
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        spec_future = pool.submit(read_spec) if proj.project_dir else None
+        issues_future = pool.submit(read_open_issues) if proj.project_dir else None
+        git_future = pool.submit(read_git_summary) if proj.repo_path else None
+        worklog_future = pool.submit(tail_entries, config, project=resolved_id, limit=log_limit)
+
+        # One scan serves all task sections below
+        all_tasks = list_tasks(config, resolved_id)
+
+        spec_content = spec_future.result() if spec_future else None
+        recent_entries = worklog_future.result()
+        summary = git_future.result() if git_future else None
+        open_issues = issues_future.result() if issues_future else None
+
+    if spec_content is not None:
+        context["spec"] = spec_content
+
+    by_state = partition_tasks(all_tasks)
+
     # Current task (in progress)
-    in_progress = list_tasks(config, resolved_id, state_filter=TaskState.PROGRESS)
+    in_progress = by_state[TaskState.PROGRESS]
     context["in_progress"] = [t.to_dict() for t in in_progress]
     
     # Next task if nothing in progress
     if not in_progress:
-        next_task = get_next_task(config, resolved_id)
+        next_task = select_next_task(all_tasks)
         if next_task:
             context["next_task"] = next_task.to_dict()
     
     # Blocked tasks
-    blocked = list_tasks(config, resolved_id, state_filter=TaskState.BLOCKED)
+    blocked = by_state[TaskState.BLOCKED]
     context["blockers"] = [t.to_dict() for t in blocked]
     
     # Open task count
-    open_tasks = list_tasks(config, resolved_id, state_filter=TaskState.OPEN)
-    context["open_count"] = len(open_tasks)
+    context["open_count"] = len(by_state[TaskState.OPEN])
     
     # Recent work log
-    recent_entries = tail_entries(config, project=resolved_id, limit=log_limit)
     context["recent_work"] = [e.to_dict() for e in recent_entries]
     
-    # Git status if repo_path exists
-    if proj.repo_path and proj.repo_path.exists():
+    # Git status if repo_path is a repo
+    if summary:
         git_status = {}
-        try:
-            # Current branch
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=proj.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                git_status["branch"] = result.stdout.strip()
-            
-            # Uncommitted changes
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=proj.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                changes = [line for line in result.stdout.strip().split('\n') if line]
-                git_status["uncommitted_count"] = len(changes)
-                if changes:
-                    git_status["uncommitted"] = changes[:10]  # Limit to 10
-                    if len(changes) > 10:
-                        git_status["uncommitted"].append(f"... and {len(changes) - 10} more")
-            
-            # Recent commits
-            result = subprocess.run(
-                ["git", "log", "--oneline", "-3"],
-                cwd=proj.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                git_status["recent_commits"] = [line for line in result.stdout.strip().split('\n') if line]
-        except Exception:
-            pass
-        
+
+        if "branch" in summary:
+            git_status["branch"] = summary["branch"]
+
+        # Uncommitted changes
+        if "changes" in summary:
+            changes = summary["changes"]
+            git_status["uncommitted_count"] = len(changes)
+            if changes:
+                git_status["uncommitted"] = changes[:10]  # Limit to 10
+                if len(changes) > 10:
+                    git_status["uncommitted"].append(f"... and {len(changes) - 10} more")
+
+        # Recent commits
+        if "recent_commits" in summary:
+            git_status["recent_commits"] = summary["recent_commits"]
+
         if git_status:
             context["git"] = git_status
     
     # Open issues
-    if proj.project_dir:
-        import json as json_mod
-        issues_file = proj.project_dir / ".agent" / "issues.jsonl"
-        if issues_file.exists():
-            try:
-                open_issues = []
-                with open(issues_file) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            issue = json_mod.loads(line)
-                            if not issue.get("fixed"):
-                                open_issues.append({
-                                    "type": issue.get("type"),
-                                    "severity": issue.get("severity"),
-                                    "summary": (issue.get("actual") or issue.get("context", ""))[:100],
-                                })
-                if open_issues:
-                    context["open_issues"] = open_issues[:5]
-            except Exception:
-                pass
+    if open_issues:
+        context["open_issues"] = open_issues
     
     output_context(context, fmt=fmt)
 
@@ -1113,6 +1252,8 @@ def log_add(
     session_key: str | None,
 ) -> None:
     """Add a work log entry."""
+    from .worklog import add_entry
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -1124,20 +1265,13 @@ def log_add(
 
     # Auto-detect changed files from git if not manually specified
     if not files and project_id:
-        project = get_project(config, project_id)
+        project = get_project_cached(ctx, config, project_id)
         if project and project.repo_path and project.repo_path.exists():
-            try:
-                result = subprocess.run(
-                    ["git", "diff", "--name-only", "HEAD"],
-                    cwd=project.repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    files = tuple(f for f in result.stdout.strip().split('\n') if f)
-            except Exception:
-                pass  # No git or error - continue without files_changed
+            # Only this path shells out, so git (and subprocess) load here
+            from .git import get_diff_files
+
+            # No git or error - continue without files_changed
+            files = tuple(get_diff_files(project.repo_path) or ())
 
     entry = add_entry(
         config,
@@ -1163,10 +1297,7 @@ def log_add(
 @click.pass_context
 def log_tail(ctx: click.Context, project_id: str | None, limit: int, follow: bool, show_all: bool) -> None:
     """Show recent work log entries (auto-filters to current project)."""
-    import time
-    import json as json_module
-    from .models import WorkLogEntry
-    from .worklog import get_worklog_path
+    from .worklog import get_worklog_path, tail_entries
 
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
@@ -1181,48 +1312,55 @@ def log_tail(ctx: click.Context, project_id: str | None, limit: int, follow: boo
     if not follow:
         return
     
+    from .models import WorkLogEntry
+    from .watch import FileWatcher
+
     # Follow mode - watch for new entries
     worklog_path = get_worklog_path(config)
     
     # Track file position
     try:
-        pos = worklog_path.stat().st_size if worklog_path.exists() else 0
+        pos = worklog_path.stat().st_size
     except OSError:
         pos = 0
     
     try:
-        while True:
-            time.sleep(1)  # Poll every second
-            
-            if not worklog_path.exists():
-                continue
-            
-            try:
-                current_size = worklog_path.stat().st_size
-            except OSError:
-                continue
+        with FileWatcher(worklog_path) as watcher:
+            while True:
+                # Wake on change (inotify) or every second (polling); re-check
+                # periodically in case the portfolio directory was replaced
+                watcher.wait(timeout=30)
+
+                # One stat; a missing file raises instead of a separate exists()
+                try:
+                    current_size = worklog_path.stat().st_size
+                except OSError:
+                    continue
             
-            if current_size > pos:
-                # New content - read from last position
-                with open(worklog_path) as f:
-                    f.seek(pos)
-                    new_lines = f.read()
-                    pos = f.tell()
-                
-                for line in new_lines.strip().split('\n'):
-                    if not line:
-                        continue
-                    try:
-                        data = json_module.loads(line)
-                        entry = WorkLogEntry.from_dict(data)
-                        
+                if current_size > pos:
+                    # New content - read from last position
+                    with open(worklog_path, "rb") as f:
+                        f.seek(pos)
+                        new_lines = f.read()
+                        pos = f.tell()
+
+                    batch = []
+                    for line in new_lines.split(b"\n"):
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = WorkLogEntry.from_dict(jsonio.loads(line))
+                        except (KeyError, ValueError, TypeError):
+                            continue
+
                         # Apply project filter
                         if project_id and entry.project != project_id:
                             continue
-                        
-                        output_worklog_entries([entry], fmt=fmt)
-                    except (json_module.JSONDecodeError, KeyError, ValueError):
-                        continue
+
+                        batch.append(entry)
+
+                    if batch:
+                        output_worklog_batch(batch, fmt=fmt)
     except KeyboardInterrupt:
         pass  # Clean exit on Ctrl+C
 
@@ -1233,6 +1371,8 @@ def log_tail(ctx: click.Context, project_id: str | None, limit: int, follow: boo
 @click.pass_context
 def log_last(ctx: click.Context, project_id: str | None, show_all: bool) -> None:
     """Show the most recent work log entry (auto-filters to current project)."""
+    from .worklog import get_last_entry
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
@@ -1259,6 +1399,11 @@ def log_last(ctx: click.Context, project_id: str | None, show_all: bool) -> None
 @click.pass_context
 def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id: str | None, dry_run: bool) -> None:
     """Log recent git commits to work log (pull-based, deduplicates)."""
+    import subprocess
+    from .git import get_commit_files
+    from .models import WorkLogEntry
+    from .worklog import append_entries, get_logged_commit_hashes
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
 
@@ -1268,7 +1413,7 @@ def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id:
     if task_id:
         task_id = expand_task_id(task_id, project_id)
 
-    proj = get_project(config, project_id)
+    proj = get_project_cached(ctx, config, project_id)
     if not proj:
         output_error("project_not_found", f"Project '{project_id}' not found", fmt=fmt)
         sys.exit(1)
@@ -1284,30 +1429,34 @@ def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id:
             ["git", "log", f"-{limit}", "--format=%H%x00%aI%x00%s"],
             cwd=repo_path,
             capture_output=True,
-            text=True,
             timeout=10,
         )
         if result.returncode != 0:
-            output_error("git_error", f"git log failed: {result.stderr.strip()}", fmt=fmt)
+            output_error("git_error", f"git log failed: {result.stderr.decode(errors='replace').strip()}", fmt=fmt)
             sys.exit(1)
     except Exception as e:
         output_error("git_error", f"Failed to run git: {e}", fmt=fmt)
         sys.exit(1)
 
+    # Split the raw bytes on ASCII delimiters; only the kept fields are decoded
     commits = []
-    for line in result.stdout.strip().split('\n'):
+    for line in result.stdout.strip().split(b"\n"):
         if not line:
             continue
-        parts = line.split('\x00', 2)
+        parts = line.split(b"\x00", 2)
         if len(parts) == 3:
-            commits.append({"hash": parts[0], "date": parts[1], "subject": parts[2]})
+            commits.append({
+                "hash": parts[0].decode(),
+                "date": parts[1].decode(),
+                "subject": parts[2].decode(errors="replace"),
+            })
 
     if not commits:
         output_success("No commits found", fmt=fmt)
         return
 
     # Get already-logged hashes
-    logged_hashes = get_logged_commit_hashes(config, project=project_id)
+    logged_hashes = get_logged_commit_hashes(config, project=project_id, save=not dry_run)
 
     # Filter to new commits only
     new_commits = [c for c in commits if c["hash"] not in logged_hashes]
@@ -1326,26 +1475,18 @@ def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id:
                 click.echo(f"  {c['hash'][:8]} {c['subject']}")
         return
 
+    # Files changed in each commit, from one git log over the same range
+    try:
+        files_by_hash = get_commit_files(repo_path, limit)
+    except Exception:
+        files_by_hash = {}
+
     # Log each new commit (oldest first)
     logged = []
     for commit in reversed(new_commits):
-        # Get files changed in this commit
-        try:
-            files_result = subprocess.run(
-                ["git", "diff-tree", "--no-commit-id", "--name-status", "-r", commit["hash"]],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            files_changed = None
-            if files_result.returncode == 0 and files_result.stdout.strip():
-                files_changed = [line for line in files_result.stdout.strip().split('\n') if line]
-        except Exception:
-            files_changed = None
+        files_changed = files_by_hash.get(commit["hash"])
 
         # Parse commit timestamp
-        from datetime import datetime, timezone
         try:
             commit_ts = datetime.fromisoformat(commit["date"])
         except (ValueError, TypeError):
@@ -1355,13 +1496,12 @@ def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id:
         effective_task = task_id
         if not effective_task:
             # Look for PROJ-NNN pattern in commit message
-            import re
-            task_match = re.search(r'\b([A-Z]+-\d{3})\b', commit["subject"])
+            task_match = _COMMIT_TASK_ID_RE.search(commit["subject"])
             if task_match:
                 effective_task = task_match.group(1)
 
-        entry = add_entry(
-            config,
+        logged.append(WorkLogEntry(
+            ts=commit_ts,
             project=project_id,
             action=WorkLogAction.COMMIT,
             task=effective_task,
@@ -1369,9 +1509,10 @@ def log_commit(ctx: click.Context, project_id: str | None, limit: int, task_id:
             files_changed=files_changed,
             commit_hash=commit["hash"],
             auto=True,
-            ts=commit_ts,
-        )
-        logged.append(entry)
+        ))
+
+    # One append for the whole batch
+    append_entries(config, logged)
 
     result_data = {
         "logged": len(logged),
@@ -1405,6 +1546,8 @@ def research() -> None:
 @click.pass_context
 def research_list(ctx: click.Context, project_id: str | None, status: str | None, tags: tuple[str, ...]) -> None:
     """List research items."""
+    from .research import list_research
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -1435,6 +1578,8 @@ def research_add(
     question: str | None,
 ) -> None:
     """Add a new research item."""
+    from .research import add_research
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -1478,6 +1623,8 @@ def research_link(
     spawned_by: str | None,
 ) -> None:
     """Link a research item to an OpenClaw session."""
+    from .research import link_research_session
+
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
@@ -1514,18 +1661,22 @@ def setup(ctx: click.Context, check: bool) -> None:
     if check:
         issues: list[str] = []
 
+        # Paths stat()ed here are not checked again by validate_portfolio
+        probed = {}
+
         # Check portfolio path (defaults to ~/clawpm)
         portfolio_path = get_portfolio_path()
         if not portfolio_path:
             issues.append("No portfolio found at ~/clawpm (or set CLAWPM_PORTFOLIO env var)")
         else:
-            if not (portfolio_path / "work_log.jsonl").exists():
+            work_log = portfolio_path / "work_log.jsonl"
+            if probe_paths([work_log], probed)[work_log] is None:
                 issues.append(f"work_log.jsonl not found in {portfolio_path}")
 
         # Check portfolio config
-        config = load_portfolio_config()
+        config = load_portfolio_config(portfolio_path)
         if config:
-            portfolio_issues = validate_portfolio(config)
+            portfolio_issues = validate_portfolio(config, probed)
             issues.extend(portfolio_issues)
 
         if fmt == OutputFormat.JSON:
@@ -1549,7 +1700,7 @@ def setup(ctx: click.Context, check: bool) -> None:
         if env_portfolio:
             portfolio_root = Path(env_portfolio).expanduser()
         else:
-            portfolio_root = Path.home() / "clawpm"
+            portfolio_root = DEFAULT_PORTFOLIO_ROOT
 
         # Check if already set up
         if (portfolio_root / "portfolio.toml").exists():
@@ -1652,40 +1803,37 @@ def issues_add(
     context: str | None,
 ) -> None:
     """Log an issue for a project."""
-    import json
-    from datetime import datetime, timezone
-
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
     project_id, _ = require_project(ctx, project_id)
-    proj = get_project(config, project_id)
+    proj = get_project_cached(ctx, config, project_id)
 
     if not proj:
         output_error("project_not_found", f"Project '{project_id}' not found", fmt=fmt)
         sys.exit(1)
 
     # Create .agent directory if needed
-    agent_dir = proj.project_dir / ".agent"
-    agent_dir.mkdir(exist_ok=True)
-    issues_file = agent_dir / "issues.jsonl"
+    issues_file = proj.issues_file
+    issues_file.parent.mkdir(exist_ok=True)
 
     entry = {
         "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "type": issue_type,
         "severity": severity,
-        "command": cmd,
-        "expected": expected,
-        "actual": actual,
-        "context": context,
-        "fixed": False,
     }
-
-    # Remove None values
-    entry = {k: v for k, v in entry.items() if v is not None}
-
-    with open(issues_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    # Optional fields are only recorded when given
+    if cmd is not None:
+        entry["command"] = cmd
+    if expected is not None:
+        entry["expected"] = expected
+    if actual is not None:
+        entry["actual"] = actual
+    if context is not None:
+        entry["context"] = context
+    entry["fixed"] = False
+
+    jsonio.append_jsonl(issues_file, entry)
 
     if fmt == OutputFormat.JSON:
         output_json({"status": "logged", "file": str(issues_file), "entry": entry})
@@ -1699,19 +1847,17 @@ def issues_add(
 @click.pass_context
 def issues_list(ctx: click.Context, project_id: str | None, open_only: bool) -> None:
     """List issues for a project."""
-    import json
-
     fmt = get_format(ctx)
     config = require_portfolio(ctx)
     
     project_id, _ = require_project(ctx, project_id)
-    proj = get_project(config, project_id)
+    proj = get_project_cached(ctx, config, project_id)
 
     if not proj:
         output_error("project_not_found", f"Project '{project_id}' not found", fmt=fmt)
         sys.exit(1)
 
-    issues_file = proj.project_dir / ".agent" / "issues.jsonl"
+    issues_file = proj.issues_file
     if not issues_file.exists():
         if fmt == OutputFormat.JSON:
             output_json({"issues": [], "count": 0})
@@ -1719,15 +1865,22 @@ def issues_list(ctx: click.Context, project_id: str | None, open_only: bool) ->
             click.echo("No issues logged yet.")
         return
 
+    # Every issue is decoded before anything is written (so a malformed line
+    # fails the command without leaving partial output), which needs the
+    # whole listing anyway; read once and split instead of readline
+    with open(issues_file, "rb") as f:
+        data = f.read()
+
     issues = []
-    with open(issues_file) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                issue = json.loads(line)
-                if open_only and issue.get("fixed"):
-                    continue
-                issues.append(issue)
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if line:
+            if open_only and is_fixed_issue_line(line):
+                continue
+            issue = jsonio.loads(line)
+            if open_only and issue.get("fixed"):
+                continue
+            issues.append(issue)
 
     if fmt == OutputFormat.JSON:
         output_json({"issues": issues, "count": len(issues)})
@@ -1735,7 +1888,7 @@ def issues_list(ctx: click.Context, project_id: str | None, open_only: bool) ->
         if not issues:
             click.echo("No issues found.")
             return
-        for i, issue in enumerate(issues, 1):
+        for issue in issues:
             status = "✓" if issue.get("fixed") else "○"
             sev = issue.get("severity", "?")[0].upper()
             typ = issue.get("type", "?")
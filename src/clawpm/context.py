@@ -2,78 +2,141 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from pathlib import Path
 
-from .discovery import load_portfolio_config, get_project, is_git_repo, init_project_from_repo
-from .models import ProjectSettings
+from .discovery import load_portfolio_config, load_project_settings, get_project, is_git_repo, init_project_from_repo
+from .models import PortfolioConfig, ProjectSettings
 
 
 CONTEXT_FILE = Path.home() / ".clawpm-context"
 
+# Task reference forms understood by expand_task_id
+_FULL_TASK_ID_RE = re.compile(r'^[A-Z]+-\d+(-\d+)?$')
+_SHORT_SUBTASK_RE = re.compile(r'^(\d+)-(\d+)$')
+# Separators dropped from project IDs when deriving task prefixes
+_PREFIX_SEP_RE = re.compile(r'[-_]')
+
+
+# Per-cwd detection results. Only hits are cached, so a directory that
+# gains a project (or repo) later is still found; see clear_detect_cache()
+_project_settings_paths: dict[str, str] = {}
+_untracked_repos: dict[str, Path] = {}
+
 
 def detect_project_from_cwd() -> ProjectSettings | None:
     """Detect project from current working directory.
     
     Walks up from cwd looking for .project/settings.toml.
     Returns the project if found, None otherwise.
+    Only the settings path found for a cwd is cached; the settings themselves
+    go through load_project_settings, so edits to settings.toml are picked up.
     """
-    config = load_portfolio_config()
-    if not config:
-        return None
-    
-    cwd = Path.cwd().resolve()
-    
-    # Walk up looking for .project/settings.toml
-    current = cwd
-    while current != current.parent:
-        settings_file = current / ".project" / "settings.toml"
-        if settings_file.exists():
+    cwd = os.getcwd()
+    settings_file = _project_settings_paths.get(cwd)
+    if settings_file is not None:
+        nearest = os.path.join(cwd, ".project", "settings.toml")
+        # A project created in cwd itself since then takes precedence
+        if settings_file == nearest or not os.path.exists(nearest):
             try:
-                return ProjectSettings.load(settings_file)
+                return load_project_settings(settings_file)
             except Exception:
-                pass
-        current = current.parent
+                pass  # removed or broken since it was found; walk up again
+
+    settings_file = _find_project_settings(cwd)
+    if settings_file is None:
+        _project_settings_paths.pop(cwd, None)
+        return None
+    _project_settings_paths[cwd] = settings_file
+    return load_project_settings(settings_file)
+
+
+def _find_project_settings(cwd: str) -> str | None:
+    # Walk up looking for a loadable .project/settings.toml (plain strings,
+    # no Path per level)
+    current = os.path.realpath(cwd)
+    parent = os.path.dirname(current)
+    while parent != current:
+        settings_file = os.path.join(current, ".project", "settings.toml")
+        try:
+            load_project_settings(settings_file)
+            return settings_file
+        except Exception:
+            pass
+        current, parent = parent, os.path.dirname(parent)
     
     return None
 
 
+def cwd_in_project_roots(config: PortfolioConfig) -> bool:
+    """Check whether cwd is strictly below one of the configured project roots.
+
+    A string prefix test on os.getcwd(), so no filesystem walk is needed to
+    rule out auto-init when working elsewhere.
+    """
+    cwd = os.getcwd()
+    return any(cwd.startswith(os.path.join(root, "")) for root in config.resolved_project_roots)
+
+
 def detect_untracked_repo_from_cwd() -> Path | None:
     """Detect if cwd is inside an untracked git repo.
     
     Returns the repo root path if found, None otherwise.
+    A found repo is cached per cwd until it gains .project/settings.toml.
     """
+    cwd = os.getcwd()
+    repo = _untracked_repos.get(cwd)
+    if repo is not None and not os.path.exists(os.path.join(repo, ".project", "settings.toml")):
+        return repo
+
+    repo = _find_untracked_repo(cwd)
+    if repo is None:
+        _untracked_repos.pop(cwd, None)
+    else:
+        _untracked_repos[cwd] = repo
+    return repo
+
+
+def _find_untracked_repo(cwd: str) -> Path | None:
     config = load_portfolio_config()
     if not config:
         return None
     
-    cwd = Path.cwd().resolve()
-    
-    # Walk up looking for .git (but not .project)
-    current = cwd
-    while current != current.parent:
-        if (current / ".git").exists() and not (current / ".project" / "settings.toml").exists():
-            # Check if this is under a project_root
-            for root in config.project_roots:
-                try:
-                    if root.resolve() in current.parents or root.resolve() == current.parent:
-                        return current
-                except Exception:
-                    pass
-        current = current.parent
+    # Walk up looking for .git (but not .project). Only repos strictly below
+    # a project root count, so the walk stops once it leaves every root.
+    roots = tuple(os.path.join(root, "") for root in config.resolved_project_roots)
+    current = os.path.realpath(cwd)
+    parent = os.path.dirname(current)
+    while parent != current and current.startswith(roots):
+        if (
+            os.path.exists(os.path.join(current, ".git"))
+            and not os.path.exists(os.path.join(current, ".project", "settings.toml"))
+        ):
+            return Path(current)
+        current, parent = parent, os.path.dirname(parent)
     
     return None
 
 
-def auto_init_if_untracked() -> ProjectSettings | None:
+def clear_detect_cache() -> None:
+    """Forget cached cwd detection results, e.g. after creating a project."""
+    _project_settings_paths.clear()
+    _untracked_repos.clear()
+
+
+def auto_init_if_untracked(config: PortfolioConfig | None = None) -> ProjectSettings | None:
     """Auto-initialize a project if cwd is in an untracked git repo.
     
+    The project is recorded in config's project index when config is given.
     Returns the newly created ProjectSettings, or None if not applicable.
     """
     repo_path = detect_untracked_repo_from_cwd()
     if repo_path:
-        return init_project_from_repo(repo_path)
+        project = init_project_from_repo(repo_path, config=config)
+        clear_detect_cache()
+        return project
     return None
 
 
@@ -127,6 +190,7 @@ def resolve_project(explicit: str | None = None) -> tuple[str | None, str]:
     return (None, "none")
 
 
+@functools.lru_cache(maxsize=64)
 def get_project_prefix(project_id: str) -> str:
     """Get the task ID prefix for a project.
     
@@ -135,14 +199,17 @@ def get_project_prefix(project_id: str) -> str:
         - my-project -> MYPRO (first 5 chars, uppercase, no hyphens)
     """
     # Remove hyphens/underscores and uppercase
-    clean = re.sub(r'[-_]', '', project_id).upper()
+    clean = _PREFIX_SEP_RE.sub('', project_id).upper()
     # Take first 5 chars
     return clean[:5]
 
 
+@functools.lru_cache(maxsize=128)
 def expand_task_id(task_ref: str, project_id: str) -> str:
     """Expand a short task reference to full ID.
 
+    Pure string mapping, so results are memoized for the process lifetime.
+
     Examples:
         - "22" -> "CLAWP-022" (for clawpm project)
         - "CLAWP-022" -> "CLAWP-022" (already full)
@@ -152,11 +219,11 @@ def expand_task_id(task_ref: str, project_id: str) -> str:
     """
     # Already has a prefix (contains hyphen and letters before it)
     # Match both PREFIX-NNN and PREFIX-NNN-NNN (subtask)
-    if '-' in task_ref and re.match(r'^[A-Z]+-\d+(-\d+)?$', task_ref.upper()):
+    if '-' in task_ref and _FULL_TASK_ID_RE.match(task_ref.upper()):
         return task_ref.upper()
 
     # Subtask short ID: "4-001" or "004-001" -> "PREFIX-004-001"
-    subtask_match = re.match(r'^(\d+)-(\d+)$', task_ref)
+    subtask_match = _SHORT_SUBTASK_RE.match(task_ref)
     if subtask_match:
         prefix = get_project_prefix(project_id)
         parent_num = int(subtask_match.group(1))
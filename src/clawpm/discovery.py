@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import os
-import subprocess
-from dataclasses import dataclass
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from . import jsonio
 from .models import PortfolioConfig, ProjectSettings, ProjectStatus
 
+# Resolved once; $HOME does not change during a run
+_HOME = Path.home()
+DEFAULT_PORTFOLIO_ROOT = _HOME / "clawpm"
+
+# Characters of a repo directory name that become "-" in its project ID
+_ID_TRANS = str.maketrans({" ": "-", "_": "-"})
+
+# A top-level `status = "..."` line, and the first table header after which
+# keys are no longer top-level
+_STATUS_LINE_RE = re.compile(rb'^status[ \t]*=[ \t]*"(\w+)"[ \t]*(?:#.*)?$', re.MULTILINE)
+_TABLE_HEADER_RE = re.compile(rb'^[ \t]*\[', re.MULTILINE)
+
 
 @dataclass
 class UntrackedRepo:
@@ -30,12 +46,21 @@ class UntrackedRepo:
 def path_for_config(p: Path) -> str:
     """Convert a path to a config-friendly string, using ~/ when possible."""
     try:
-        relative = p.relative_to(Path.home())
+        relative = p.relative_to(_HOME)
         return f"~/{relative}"
     except ValueError:
         return str(p)
 
 
+def toml_string(value: str) -> str:
+    """Quote a string as a TOML basic string.
+
+    A JSON string literal is also a valid TOML basic string, apart from
+    DEL, which TOML requires to be escaped.
+    """
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007F")
+
+
 def get_portfolio_path() -> Path | None:
     """Get the portfolio path from default location or environment override.
     
@@ -49,9 +74,8 @@ def get_portfolio_path() -> Path | None:
             return path
 
     # Default location: ~/clawpm
-    default = Path.home() / "clawpm"
-    if default.exists():
-        return default
+    if DEFAULT_PORTFOLIO_ROOT.exists():
+        return DEFAULT_PORTFOLIO_ROOT
 
     return None
 
@@ -73,21 +97,44 @@ def load_portfolio_config(portfolio_path: Path | None = None) -> PortfolioConfig
     # Try loading from portfolio.toml if it exists
     if portfolio_path:
         config_file = portfolio_path / "portfolio.toml"
-        if config_file.exists():
-            config = PortfolioConfig.load(config_file)
-            # Merge in env var project roots
-            config = _merge_env_project_roots(config)
-            return config
+        try:
+            st = config_file.stat()
+        except OSError:
+            st = None
+        if st is not None:
+            return _load_portfolio_file(
+                str(config_file),
+                st.st_mtime_ns,
+                st.st_size,
+                os.environ.get("CLAWPM_PROJECT_ROOTS"),
+            )
 
     # No portfolio.toml - use defaults
     return _default_portfolio_config()
 
 
+@functools.lru_cache(maxsize=8)
+def _load_portfolio_file(
+    config_file: str,
+    mtime_ns: int,
+    size: int,
+    env_roots: str | None,
+) -> PortfolioConfig:
+    """Parse portfolio.toml, memoized on its mtime/size and CLAWPM_PROJECT_ROOTS.
+
+    The extra arguments are only part of the cache key, so an edited file or a
+    changed environment produces a fresh parse.
+    """
+    config = PortfolioConfig.load(Path(config_file))
+    # Merge in env var project roots
+    return _merge_env_project_roots(config)
+
+
 def _default_portfolio_config() -> PortfolioConfig:
     """Create a default portfolio config with sensible defaults."""
     from .models import PortfolioConfig, ProjectStatus
     
-    portfolio_root = Path.home() / "clawpm"
+    portfolio_root = DEFAULT_PORTFOLIO_ROOT
     
     # Default project roots: ~/clawpm/projects
     project_roots = [portfolio_root / "projects"]
@@ -103,7 +150,7 @@ def _default_portfolio_config() -> PortfolioConfig:
     if ws := os.environ.get("CLAWPM_WORKSPACE"):
         openclaw_workspace = Path(ws).expanduser()
     else:
-        default_ws = Path.home() / ".openclaw" / "workspace"
+        default_ws = _HOME / ".openclaw" / "workspace"
         if default_ws.exists():
             openclaw_workspace = default_ws
     
@@ -126,6 +173,71 @@ def _merge_env_project_roots(config: PortfolioConfig) -> PortfolioConfig:
     return config
 
 
+def load_project_settings(settings_file: str | Path) -> ProjectSettings:
+    """Load a project's settings.toml, reusing the parse while it is unchanged.
+
+    One stat() gives the file's mtime and size; a file not edited since it
+    was last parsed in this process is served from the cache. Each caller
+    gets its own copy (labels included), so mutating the result does not
+    leak into later loads. On filesystems with coarse timestamps, an edit
+    that keeps the file's size and lands within the same timestamp tick as
+    the previous parse (e.g. "active" -> "paused") is not noticed until
+    the file changes again.
+    """
+    st = os.stat(settings_file)
+    cached = _load_settings_file(os.fspath(settings_file), st.st_mtime_ns, st.st_size)
+    return replace(cached, labels=list(cached.labels))
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_settings_file(settings_file: str, mtime_ns: int, size: int) -> ProjectSettings:
+    """Parse settings.toml; mtime_ns and size are only part of the cache key."""
+    return ProjectSettings.load(settings_file)
+
+
+def _peek_status(settings_file: str) -> str | None:
+    """The status set in the first 512 bytes of settings.toml, if plainly visible.
+
+    None means "unknown" (no simple top-level status line was found), not
+    the default status; callers then fall back to a full parse.
+    """
+    try:
+        with open(settings_file, "rb") as f:
+            head = f.read(512)
+    except OSError:
+        return None
+    m = _STATUS_LINE_RE.search(head)
+    if not m:
+        return None
+    before = head[:m.start()]
+    if _TABLE_HEADER_RE.search(before) or b'"""' in before or b"'''" in before:
+        return None  # inside a table or possibly a multi-line string
+    return m.group(1).decode()
+
+
+def _scan_subdirs(root: Path) -> list[os.DirEntry]:
+    """List root's subdirectories (symlinks to directories included).
+
+    One scandir() call; each entry's type comes from the directory listing
+    rather than a stat per item. A missing or unreadable root lists nothing.
+    """
+    try:
+        with os.scandir(root) as it:
+            return [entry for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _iter_settings_files(root: Path) -> Iterator[str]:
+    """Yield the .project/settings.toml path under each subdirectory of root.
+
+    The settings files are not checked, so callers simply try to load them.
+    Paths are plain strings: a Path is only built once a file actually loads.
+    """
+    for entry in _scan_subdirs(root):
+        yield os.path.join(entry.path, ".project", "settings.toml")
+
+
 def discover_projects(
     config: PortfolioConfig,
     status_filter: ProjectStatus | None = None,
@@ -134,31 +246,29 @@ def discover_projects(
     projects: list[ProjectSettings] = []
 
     for root in config.project_roots:
-        if not root.exists():
-            continue
-
         # Skip OpenClaw workspace if configured
         if config.openclaw_workspace and root == config.openclaw_workspace:
             continue
 
         # Look for .project/settings.toml in immediate subdirectories
-        for item in root.iterdir():
-            if not item.is_dir():
-                continue
+        for settings_file in _iter_settings_files(root):
+            # A status line that plainly mismatches skips the TOML parse
+            if status_filter is not None:
+                peeked = _peek_status(settings_file)
+                if peeked is not None and peeked != status_filter.value:
+                    continue
 
-            settings_file = item / ".project" / "settings.toml"
-            if settings_file.exists():
-                try:
-                    project = ProjectSettings.load(settings_file)
+            try:
+                project = load_project_settings(settings_file)
+            except Exception:
+                # Skip missing or malformed settings
+                continue
 
-                    # Apply status filter
-                    if status_filter is not None and project.status != status_filter:
-                        continue
+            # Apply status filter
+            if status_filter is not None and project.status != status_filter:
+                continue
 
-                    projects.append(project)
-                except Exception:
-                    # Skip malformed projects
-                    continue
+            projects.append(project)
 
     # Sort by priority (lower is higher priority), then by name
     projects.sort(key=lambda p: (p.priority, p.name))
@@ -166,33 +276,89 @@ def discover_projects(
     return projects
 
 
+def get_project_index_path(config: PortfolioConfig) -> Path:
+    """Get the project index path (project ID -> directory lookup hints)."""
+    return config.portfolio_root / "index.jsonl"
+
+
+def record_project(config: PortfolioConfig, project_id: str, project_dir: Path) -> None:
+    """Note a new project's directory in the index, so get_project skips the scan.
+
+    The index is only a hint: entries are verified on use, and a missing or
+    unwritable index just means lookups scan as before.
+    """
+    entry = {"id": project_id, "path": os.path.realpath(project_dir)}
+    try:
+        jsonio.append_jsonl(get_project_index_path(config), entry)
+    except OSError:
+        pass
+
+
+def _read_project_index(config: PortfolioConfig) -> dict[str, str]:
+    index_file = get_project_index_path(config)
+    try:
+        st = os.stat(index_file)
+    except OSError:
+        return {}
+    return _load_project_index(str(index_file), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_project_index(index_file: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse index.jsonl into {id: resolved project dir}; later lines win."""
+    index: dict[str, str] = {}
+    with open(index_file, "rb") as f:
+        for line in f:
+            try:
+                entry = jsonio.loads(line)
+                index[entry["id"]] = entry["path"]
+            except (ValueError, KeyError, TypeError):
+                continue
+    return index
+
+
 def get_project(config: PortfolioConfig, project_id: str) -> ProjectSettings | None:
-    """Get a specific project by ID."""
-    for root in config.project_roots:
-        if not root.exists():
-            continue
+    """Get a specific project by ID.
 
+    A directory named after the ID is checked first, then the directory the
+    project index records for it; if either's settings carry that ID no scan
+    is needed. Otherwise the root is scanned for the ID, and a same-named
+    directory is the fallback result.
+    """
+    indexed = _read_project_index(config).get(project_id)
+
+    for root, resolved_root in zip(config.project_roots, config.resolved_project_roots):
         # Check direct match first
-        direct = root / project_id / ".project" / "settings.toml"
-        if direct.exists():
+        try:
+            direct = load_project_settings(os.path.join(root, project_id, ".project", "settings.toml"))
+        except Exception:
+            direct = None
+        if direct is not None and direct.id == project_id:
+            return direct
+
+        # Then an indexed directory under this root (loaded via the root, so
+        # project_dir has the same form a scan would give)
+        if indexed is not None and os.path.dirname(indexed) == resolved_root:
             try:
-                return ProjectSettings.load(direct)
+                project = load_project_settings(
+                    os.path.join(root, os.path.basename(indexed), ".project", "settings.toml")
+                )
             except Exception:
-                pass
+                project = None
+            if project is not None and project.id == project_id:
+                return project
 
         # Search all projects
-        for item in root.iterdir():
-            if not item.is_dir():
+        for settings_file in _iter_settings_files(root):
+            try:
+                project = load_project_settings(settings_file)
+            except Exception:
                 continue
+            if project.id == project_id:
+                return project
 
-            settings_file = item / ".project" / "settings.toml"
-            if settings_file.exists():
-                try:
-                    project = ProjectSettings.load(settings_file)
-                    if project.id == project_id:
-                        return project
-                except Exception:
-                    continue
+        if direct is not None:
+            return direct
 
     return None
 
@@ -207,59 +373,33 @@ def get_project_dir(config: PortfolioConfig, project_id: str) -> Path | None:
 
 def discover_untracked_repos(config: PortfolioConfig) -> list[UntrackedRepo]:
     """Discover git repos in project_roots that don't have .project/ tracking."""
+    from .git import get_remote_url
+
     untracked: list[UntrackedRepo] = []
     
-    # Get IDs of tracked projects to exclude
-    tracked_paths = set()
+    # Find git repos without .project/. A directory (or symlink to one) is
+    # tracked exactly when settings.toml is reachable inside it, so one pass
+    # over each root answers both questions.
     for root in config.project_roots:
-        if not root.exists():
-            continue
-        for item in root.iterdir():
-            if not item.is_dir():
-                continue
-            if (item / ".project" / "settings.toml").exists():
-                tracked_paths.add(item.resolve())
-    
-    # Find git repos without .project/
-    for root in config.project_roots:
-        if not root.exists():
-            continue
-        
         # Skip OpenClaw workspace
         if config.openclaw_workspace and root == config.openclaw_workspace:
             continue
         
-        for item in root.iterdir():
-            if not item.is_dir():
-                continue
-            
+        for entry in _scan_subdirs(root):
             # Skip if already tracked
-            if item.resolve() in tracked_paths:
+            if os.path.exists(os.path.join(entry.path, ".project", "settings.toml")):
                 continue
             
-            # Check if it's a git repo
-            if not (item / ".git").exists():
+            # Check if it's a git repo (.git may be a directory, or a file
+            # for worktrees and submodules)
+            if not os.path.exists(os.path.join(entry.path, ".git")):
                 continue
             
-            # Get remote URL if available
-            remote = None
-            try:
-                result = subprocess.run(
-                    ["git", "remote", "get-url", "origin"],
-                    cwd=item,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    remote = result.stdout.strip()
-            except Exception:
-                pass
-            
+            item = Path(entry.path)
             untracked.append(UntrackedRepo(
                 path=item,
                 name=item.name,
-                remote=remote,
+                remote=get_remote_url(item),
             ))
     
     # Sort by name
@@ -269,125 +409,155 @@ def discover_untracked_repos(config: PortfolioConfig) -> list[UntrackedRepo]:
 
 
 def is_git_repo(path: Path) -> bool:
-    """Check if a path is a git repository."""
-    return (path / ".git").exists()
+    """Check if a path is a git repository (or worktree, where .git is a file)."""
+    return os.path.exists(os.path.join(path, ".git"))
+
+
+# Templates for the files written when auto-initializing a repo; settings
+# values are pre-quoted with toml_string()
+_REPO_SETTINGS_TEMPLATE = """id = {id}
+name = {name}
+status = "active"
+priority = 5
+repo_path = {repo_path}
+"""
+
+_REPO_SPEC_TEMPLATE = """# {name}
+
+## Purpose
+
+(Describe the purpose of this project)
+
+## Goals
+
+- (Add goals)
+
+## Notes
+
+Auto-initialized by clawpm from git repo.
+"""
 
 
-def init_project_from_repo(repo_path: Path, project_id: str | None = None) -> ProjectSettings | None:
+def init_project_from_repo(
+    repo_path: Path,
+    project_id: str | None = None,
+    config: PortfolioConfig | None = None,
+) -> ProjectSettings | None:
     """Initialize a .project/ structure in a git repo.
     
     Auto-detects project name from directory and remote.
+    If config is given, the new project is recorded in its project index.
     Returns the created ProjectSettings.
     """
+    from .git import get_remote_url
+
     if not repo_path.is_dir():
         return None
     
     # Generate project ID from directory name if not provided
     if not project_id:
-        project_id = repo_path.name.lower().replace(" ", "-").replace("_", "-")
+        project_id = repo_path.name.lower().translate(_ID_TRANS)
     
     # Generate project name from directory or remote
     project_name = repo_path.name
     
     # Try to get a better name from git remote
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            remote = result.stdout.strip()
-            # Extract repo name from remote URL
-            # e.g., git@github.com:user/repo.git -> repo
-            # or https://github.com/user/repo.git -> repo
-            if "/" in remote:
-                name = remote.split("/")[-1]
-                if name.endswith(".git"):
-                    name = name[:-4]
-                project_name = name
-    except Exception:
-        pass
+    remote = get_remote_url(repo_path)
+    # Extract repo name from remote URL
+    # e.g., git@github.com:user/repo.git -> repo
+    # or https://github.com/user/repo.git -> repo
+    if remote and "/" in remote:
+        name = remote.split("/")[-1]
+        if name.endswith(".git"):
+            name = name[:-4]
+        project_name = name
     
-    # Create .project directory structure
+    # Create .project directory structure, parents first (one mkdir each)
     project_dir = repo_path / ".project"
     project_dir.mkdir(exist_ok=True)
+    for subdir in ("tasks", "tasks/done", "tasks/blocked", "research", "notes"):
+        (project_dir / subdir).mkdir(exist_ok=True)
     
-    tasks_dir = project_dir / "tasks"
-    tasks_dir.mkdir(exist_ok=True)
-    (tasks_dir / "done").mkdir(exist_ok=True)
-    (tasks_dir / "blocked").mkdir(exist_ok=True)
+    # Write settings.toml, SPEC.md and learnings.md
+    fields = {
+        "id": toml_string(project_id),
+        "name": toml_string(project_name),
+        "repo_path": toml_string(path_for_config(repo_path)),
+    }
+    files = {
+        project_dir / "settings.toml": _REPO_SETTINGS_TEMPLATE.format_map(fields).encode(),
+        project_dir / "SPEC.md": _REPO_SPEC_TEMPLATE.format(name=project_name).encode(),
+        project_dir / "learnings.md": f"# Learnings - {project_name}\n\n".encode(),
+    }
+    for path, data in files.items():
+        path.write_bytes(data)
     
-    (project_dir / "research").mkdir(exist_ok=True)
-    (project_dir / "notes").mkdir(exist_ok=True)
+    if config:
+        record_project(config, project_id, repo_path)
     
-    # Write settings.toml
-    repo_path_str = path_for_config(repo_path)
-    settings_content = f'''id = "{project_id}"
-name = "{project_name}"
-status = "active"
-priority = 5
-repo_path = "{repo_path_str}"
-'''
-    (project_dir / "settings.toml").write_text(settings_content)
-    
-    # Create minimal SPEC.md
-    spec_content = f'''# {project_name}
-
-## Purpose
-
-(Describe the purpose of this project)
-
-## Goals
+    # Load and return the project
+    return ProjectSettings.load(project_dir / "settings.toml")
 
-- (Add goals)
 
-## Notes
+def probe_paths(
+    paths: Iterable[Path],
+    probed: dict[Path, os.stat_result | None] | None = None,
+) -> dict[Path, os.stat_result | None]:
+    """stat() each path not already in probed; missing paths map to None."""
+    if probed is None:
+        probed = {}
+    for path in paths:
+        if path not in probed:
+            try:
+                probed[path] = os.stat(path)
+            except OSError:
+                probed[path] = None
+    return probed
 
-Auto-initialized by clawpm from git repo.
-'''
-    (project_dir / "SPEC.md").write_text(spec_content)
-    
-    # Create learnings.md
-    (project_dir / "learnings.md").write_text(f"# Learnings - {project_name}\n\n")
-    
-    # Load and return the project
-    return ProjectSettings.load(project_dir / "settings.toml")
 
+def validate_portfolio(
+    config: PortfolioConfig,
+    probed: dict[Path, os.stat_result | None] | None = None,
+) -> list[str]:
+    """Validate portfolio configuration and return issues.
 
-def validate_portfolio(config: PortfolioConfig) -> list[str]:
-    """Validate portfolio configuration and return issues."""
+    Paths already stat()ed by the caller can be passed in ``probed`` (see
+    probe_paths) so they are not checked twice.
+    """
     issues: list[str] = []
 
+    # Every existence check below is answered from one stat per path
+    work_log = config.portfolio_root / "work_log.jsonl"
+    probed = probe_paths([config.portfolio_root, *config.project_roots, work_log], probed)
+
     # Check portfolio root exists
-    if not config.portfolio_root.exists():
+    if probed[config.portfolio_root] is None:
         issues.append(f"Portfolio root does not exist: {config.portfolio_root}")
 
-    # Check project roots exist
-    for root in config.project_roots:
-        if not root.exists():
-            issues.append(f"Project root does not exist: {root}")
+    # Check project roots exist and, if configured, that none overlaps the
+    # OpenClaw workspace (resolved once, compared as strings)
+    collisions: list[str] = []
+    try:
+        workspace = str(config.openclaw_workspace.resolve()) if config.openclaw_workspace else None
+        resolved_roots = config.resolved_project_roots
+    except Exception:
+        workspace, resolved_roots = None, ()
+    workspace_prefix = os.path.join(workspace, "") if workspace else None
 
-    # Check for OpenClaw workspace collision
-    if config.openclaw_workspace:
-        for root in config.project_roots:
-            try:
-                if root.resolve() == config.openclaw_workspace.resolve():
-                    issues.append(
-                        f"Project root overlaps with OpenClaw workspace: {root}"
-                    )
-                elif config.openclaw_workspace.resolve() in root.resolve().parents:
-                    issues.append(
-                        f"Project root is inside OpenClaw workspace: {root}"
-                    )
-            except Exception:
-                pass
+    for i, root in enumerate(config.project_roots):
+        if probed[root] is None:
+            issues.append(f"Project root does not exist: {root}")
+        if workspace is None:
+            continue
+        resolved = resolved_roots[i]
+        if resolved == workspace:
+            collisions.append(f"Project root overlaps with OpenClaw workspace: {root}")
+        elif resolved.startswith(workspace_prefix):
+            collisions.append(f"Project root is inside OpenClaw workspace: {root}")
+    issues.extend(collisions)
 
     # Check work log exists
-    work_log = config.portfolio_root / "work_log.jsonl"
-    if not work_log.exists():
+    if probed[work_log] is None:
         issues.append(f"Work log does not exist: {work_log}")
 
     return issues
@@ -0,0 +1,253 @@
+"""Git helpers for ClawPM."""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+# Read-only queries skip git's opportunistic index refresh, so they never
+# rewrite .git/index or contend for index.lock with the user's own git.
+# The binary is looked up on PATH once rather than by every exec, and
+# close_fds is off. Together with passing the repo as ``-C <path>`` instead
+# of cwd=, this lets subprocess use posix_spawn rather than fork/exec.
+# The trade-off: fds that clawpm opens itself are non-inheritable, but any
+# inheritable fds clawpm was started with (a harness's pipes, fds 3+ from
+# the parent shell) are passed on to each short-lived git child as well.
+_GIT = (shutil.which("git") or "git", "--no-optional-locks")
+
+
+def get_changed_files(repo_path: Path, timeout: float = 5) -> list[str] | None:
+    """List tracked files with uncommitted changes (staged or unstaged).
+
+    Uses NUL-delimited porcelain status and skips the untracked-file walk.
+    Returns None if git fails or nothing has changed.
+    """
+    try:
+        result = subprocess.run(
+            [*_GIT, "-C", repo_path, "status", "--porcelain", "-z", "--untracked-files=no"],
+            capture_output=True,
+            timeout=timeout,
+            close_fds=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+
+    files: list[str] = []
+    records = iter(result.stdout.split(b"\x00"))
+    for record in records:
+        if len(record) < 4:
+            continue
+        status = record[:2]
+        files.append(os.fsdecode(record[3:]))
+        if b"R" in status or b"C" in status:
+            # Renames/copies are followed by the original path
+            next(records, None)
+
+    return files or None
+
+
+def get_diff_files(repo_path: Path, timeout: float = 5) -> list[str] | None:
+    """List files that differ from HEAD (``git diff --name-only HEAD``).
+
+    Output is NUL-delimited and read as bytes, so names containing newlines
+    survive. Returns None if git fails or nothing differs.
+    """
+    try:
+        result = subprocess.run(
+            [*_GIT, "-C", repo_path, "diff", "--name-only", "-z", "HEAD"],
+            capture_output=True,
+            timeout=timeout,
+            close_fds=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+
+    files = [os.fsdecode(f) for f in result.stdout.split(b"\x00") if f]
+    return files or None
+
+
+def _start_git(repo_path: Path, *args: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [*_GIT, "-C", repo_path, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+    )
+
+
+def _finish_git(proc: subprocess.Popen, timeout: float) -> str | None:
+    """Wait for a git process; return its stdout, or None on failure/timeout."""
+    try:
+        out, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None
+    if proc.returncode != 0:
+        return None
+    return out.decode(errors="replace")
+
+
+def _parse_branch_header(header: str) -> str | None:
+    """Branch name from a '## ...' porcelain header, as rev-parse --abbrev-ref reports it."""
+    head = header[3:]
+    if head.startswith("No commits yet on ") or head.startswith("Initial commit on "):
+        return None  # unborn branch: rev-parse HEAD fails too
+    if head.startswith("HEAD (no branch)"):
+        return "HEAD"
+    return head.split("...", 1)[0].split(" ", 1)[0]
+
+
+def get_repo_summary(repo_path: Path, log_count: int = 3, timeout: float = 5) -> dict:
+    """Branch, porcelain status lines and recent one-line commits for a repo.
+
+    Runs ``git status --porcelain --branch`` and ``git log --oneline``
+    concurrently, so the branch comes from the status header instead of a
+    separate rev-parse. Keys whose command failed are omitted.
+    """
+    status_proc = _start_git(repo_path, "status", "--porcelain", "--branch")
+    log_proc = _start_git(repo_path, "log", "--oneline", f"-{log_count}")
+
+    summary: dict = {}
+    status = _finish_git(status_proc, timeout)
+    if status is not None:
+        header, _, rest = status.partition("\n")
+        if header.startswith("## "):
+            branch = _parse_branch_header(header)
+            if branch is not None:
+                summary["branch"] = branch
+        else:
+            rest = status
+        summary["changes"] = [line for line in rest.strip().split("\n") if line]
+
+    log = _finish_git(log_proc, timeout)
+    if log is not None:
+        summary["recent_commits"] = [line for line in log.strip().split("\n") if line]
+
+    return summary
+
+
+def get_commit_files(repo_path: Path, limit: int, timeout: float = 10) -> dict[str, list[str]]:
+    """Map each of the last ``limit`` commits to its ``--name-status`` lines.
+
+    One ``git log`` replaces a ``git diff-tree --no-commit-id --name-status -r``
+    per commit, with matching output: renames are not detected, and root and
+    merge commits have no entry (diff-tree prints nothing for them).
+    """
+    result = subprocess.run(
+        [*_GIT, "-C", repo_path, "log", f"-{limit}", "--name-status", "--no-renames", "--format=%x00%H%x00%P"],
+        capture_output=True,
+        timeout=timeout,
+        close_fds=False,
+    )
+    if result.returncode != 0:
+        return {}
+
+    files_by_hash: dict[str, list[str]] = {}
+    fields = result.stdout.split(b"\x00")
+    for commit_hash, body in zip(fields[1::2], fields[2::2]):
+        parents, _, changes = body.partition(b"\n")
+        if not parents.strip():
+            continue  # root commit
+        files = [line for line in changes.decode(errors="replace").split("\n") if line]
+        if files:
+            files_by_hash[commit_hash.decode()] = files
+
+    return files_by_hash
+
+
+# A git config section header: [name] or [name "subsection"]
+_CONFIG_SECTION_RE = re.compile(r'\[\s*([A-Za-z0-9.-]+)\s*(?:"((?:[^"\\]|\\.)*)")?\s*\]$')
+
+# Environment that can change what ``git config`` sees
+_CONFIG_ENV = ("GIT_DIR", "GIT_CONFIG", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_SYSTEM", "GIT_CONFIG_COUNT", "GIT_CONFIG_PARAMETERS")
+
+
+@functools.cache
+def _global_config_may_rewrite() -> bool:
+    """Whether user/system git config could rewrite or add remote URLs."""
+    if any(name in os.environ for name in _CONFIG_ENV):
+        return True
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    for path in (os.path.expanduser("~/.gitconfig"), os.path.join(xdg, "git", "config"), "/etc/gitconfig"):
+        try:
+            with open(path, "rb") as f:
+                data = f.read().lower()
+        except OSError:
+            continue
+        if b"insteadof" in data or b"[include" in data or b"[remote" in data:
+            return True
+    return False
+
+
+def _parse_origin_url(text: str) -> tuple[bool, str | None]:
+    """Find remote.origin.url in a repo's config file.
+
+    Returns (handled, url). Only plain configs are handled; anything that
+    ``git remote get-url`` would treat specially (includes, URL rewrites,
+    legacy or unusual syntax, quoted values) yields handled=False.
+    """
+    url = None
+    in_origin = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[":
+            m = _CONFIG_SECTION_RE.match(line)
+            if not m:
+                return (False, None)
+            name = m.group(1).lower()
+            if name in ("include", "includeif", "url") or "." in name:
+                return (False, None)
+            in_origin = name == "remote" and m.group(2) == "origin"
+            continue
+        if in_origin and url is None:
+            key, eq, value = line.partition("=")
+            if key.strip().lower() != "url":
+                continue
+            value = value.strip()
+            if not eq or not value or any(c in value for c in '"\\;#'):
+                return (False, None)
+            url = value
+    return (True, url)
+
+
+def get_remote_url(repo_path: Path, timeout: float = 5) -> str | None:
+    """URL of the repo's origin remote, as ``git remote get-url origin`` prints it.
+
+    Plain repos are answered by reading .git/config directly; worktrees
+    (where .git is a file), URL rewrites and other config git would
+    interpret fall back to running git. Returns None if there is no origin.
+    """
+    if not _global_config_may_rewrite():
+        try:
+            text = (repo_path / ".git" / "config").read_text(errors="replace")
+        except OSError:
+            text = None
+        if text is not None:
+            handled, url = _parse_origin_url(text)
+            if handled:
+                return url
+
+    try:
+        result = subprocess.run(
+            [_GIT[0], "-C", repo_path, "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            close_fds=False,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
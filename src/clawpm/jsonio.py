@@ -0,0 +1,61 @@
+"""JSON encoding helpers for ClawPM.
+
+Uses orjson when it is installed (``pip install clawpm[fast]``) and falls
+back to the standard library otherwise. Both backends produce the same
+bytes: UTF-8, two-space indent when pretty, and ``str()`` for values JSON
+cannot represent (datetimes, paths) unless another ``default`` is given.
+Non-ASCII text is written as-is rather than as ``\\uXXXX`` escapes, since
+orjson has no option to escape it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+if orjson is not None:
+    _BASE_OPTS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, *, indent: bool = False, newline: bool = False, default: Callable[[Any], Any] = str) -> bytes:
+        """Encode obj as UTF-8 JSON bytes; default converts unsupported values."""
+        opts = _BASE_OPTS
+        if indent:
+            opts |= orjson.OPT_INDENT_2
+        if newline:
+            opts |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default, option=opts)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj: Any, *, indent: bool = False, newline: bool = False, default: Callable[[Any], Any] = str) -> bytes:
+        """Encode obj as UTF-8 JSON bytes; default converts unsupported values."""
+        if indent:
+            text = json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False)
+        if newline:
+            text += "\n"
+        return text.encode()
+
+    loads = json.loads
+
+
+def append_jsonl(path: Path, obj: Any) -> None:
+    """Append obj to a JSONL file as one line.
+
+    The line is encoded up front and handed to an unbuffered append-mode
+    file, so it reaches the file in a single write() with no text-layer
+    buffering in between.
+    """
+    data = dumps(obj, newline=True)
+    with open(path, "ab", buffering=0) as f:
+        f.write(data)
@@ -6,6 +6,7 @@ import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +15,17 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
-import yaml
+
+@cache
+def _yaml_loader() -> type:
+    """Return PyYAML's libyaml-backed safe loader, or the pure-Python one.
+
+    CSafeLoader only exists when PyYAML was built against libyaml; it
+    parses the same documents as SafeLoader, several times faster.
+    """
+    import yaml  # deferred: only task/research parsing needs it
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class ProjectStatus(str, Enum):
@@ -97,6 +108,11 @@ class PortfolioConfig:
             openclaw_workspace=openclaw_workspace,
         )
 
+    @cached_property
+    def resolved_project_roots(self) -> tuple[str, ...]:
+        """Project roots as resolved path strings, for cheap prefix checks."""
+        return tuple(str(p.resolve()) for p in self.project_roots)
+
 
 @dataclass
 class ProjectSettings:
@@ -111,7 +127,7 @@ class ProjectSettings:
     project_dir: Path | None = None  # Set after loading
 
     @classmethod
-    def load(cls, path: Path) -> ProjectSettings:
+    def load(cls, path: Path | str) -> ProjectSettings:
         """Load project settings from TOML file."""
         with open(path, "rb") as f:
             data = tomllib.load(f)
@@ -128,9 +144,23 @@ class ProjectSettings:
             repo_path=repo_path,
             labels=data.get("labels", []),
         )
-        settings.project_dir = path.parent.parent
+        settings.project_dir = Path(path).parent.parent
         return settings
 
+    @cached_property
+    def issues_file(self) -> Path | None:
+        """The project's .agent/issues.jsonl (which may not exist yet)."""
+        if self.project_dir is None:
+            return None
+        return self.project_dir.joinpath(".agent", "issues.jsonl")
+
+    @cached_property
+    def spec_file(self) -> Path | None:
+        """The project's .project/SPEC.md (which may not exist)."""
+        if self.project_dir is None:
+            return None
+        return self.project_dir.joinpath(".project", "SPEC.md")
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON output."""
         return {
@@ -144,7 +174,20 @@ class ProjectSettings:
         }
 
 
-@dataclass
+def task_state_from_path(path: Path) -> TaskState:
+    """Determine a task's state from its filename/location."""
+    # Check path components for done/blocked (handles both regular files and task directories)
+    path_parts = path.parts
+    if "done" in path_parts:
+        return TaskState.DONE
+    if "blocked" in path_parts:
+        return TaskState.BLOCKED
+    if ".progress" in path.name:
+        return TaskState.PROGRESS
+    return TaskState.OPEN
+
+
+@dataclass(slots=True)
 class Task:
     """A task with frontmatter and content."""
 
@@ -173,19 +216,12 @@ class Task:
     @classmethod
     def from_file(cls, path: Path) -> Task:
         """Load task from markdown file with YAML frontmatter."""
+        import yaml
+
         text = path.read_text()
 
         # Determine state from filename/location
-        # Check path components for done/blocked (handles both regular files and task directories)
-        path_parts = path.parts
-        if "done" in path_parts:
-            state = TaskState.DONE
-        elif "blocked" in path_parts:
-            state = TaskState.BLOCKED
-        elif ".progress" in path.name:
-            state = TaskState.PROGRESS
-        else:
-            state = TaskState.OPEN
+        state = task_state_from_path(path)
 
         # Parse frontmatter
         frontmatter: dict[str, Any] = {}
@@ -195,7 +231,7 @@ class Task:
             parts = text.split("---", 2)
             if len(parts) >= 3:
                 try:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
+                    frontmatter = yaml.load(parts[1], Loader=_yaml_loader()) or {}
                     content = parts[2].strip()
                 except yaml.YAMLError:
                     pass
@@ -269,7 +305,7 @@ class Task:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkLogEntry:
     """A work log entry."""
 
@@ -331,7 +367,7 @@ class WorkLogEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Research:
     """A research item."""
 
@@ -348,6 +384,8 @@ class Research:
     @classmethod
     def from_file(cls, path: Path) -> Research:
         """Load research from markdown file with YAML frontmatter."""
+        import yaml
+
         text = path.read_text()
 
         # Parse frontmatter
@@ -358,7 +396,7 @@ class Research:
             parts = text.split("---", 2)
             if len(parts) >= 3:
                 try:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
+                    frontmatter = yaml.load(parts[1], Loader=_yaml_loader()) or {}
                     content = parts[2].strip()
                 except yaml.YAMLError:
                     pass
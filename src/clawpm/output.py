@@ -4,18 +4,43 @@ from __future__ import annotations
 
 import json
 import sys
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import Enum
 from typing import Any
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+from . import jsonio
 
 
-console = Console()
-error_console = Console(stderr=True)
+class _LazyConsole:
+    """A rich Console created on first use.
+
+    JSON output never touches rich, so importing it is deferred until text
+    output actually prints something.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._console = None
+
+    def _get(self):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __enter__(self):
+        return self._get().__enter__()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._get().__exit__(*exc)
+
+
+console = _LazyConsole()
+error_console = _LazyConsole(stderr=True)
 
 
 class OutputFormat(str, Enum):
@@ -40,13 +65,42 @@ def _serialize(obj: Any) -> Any:
     return obj
 
 
+def _json_default(obj: Any) -> Any:
+    """Encoder hook: convert one non-JSON value, as _serialize does.
+
+    The encoder walks plain dicts and lists itself and calls this only for
+    the objects it cannot represent, instead of _serialize copying the whole
+    structure first.
+    """
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, "__dict__"):
+        return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
+    return str(obj)
+
+
+def _write_bytes(stream: Any, data: bytes) -> None:
+    """Write encoded bytes straight to a text stream's buffer."""
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode())
+        return
+    stream.flush()  # keep ordering with earlier text writes
+    buffer.write(data)
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write encoded bytes straight to stdout, bypassing the text layer."""
+    _write_bytes(sys.stdout, data)
+
+
 def output_json(data: Any, pretty: bool = True) -> None:
     """Output data as JSON."""
-    serialized = _serialize(data)
-    if pretty:
-        print(json.dumps(serialized, indent=2, default=str))
-    else:
-        print(json.dumps(serialized, default=str))
+    _write_stdout(jsonio.dumps(data, indent=pretty, newline=True, default=_json_default))
 
 
 def output_error(error: str, message: str, details: dict[str, Any] | None = None, fmt: OutputFormat = OutputFormat.JSON) -> None:
@@ -63,13 +117,34 @@ def output_error(error: str, message: str, details: dict[str, Any] | None = None
                 error_console.print(f"  {k}: {v}")
 
 
+@dataclass(frozen=True)
+class StaticError:
+    """An error whose message never varies, with its JSON form encoded once."""
+
+    error: str
+    message: str
+    payload: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        data = json.dumps({"error": self.error, "message": self.message}) + "\n"
+        object.__setattr__(self, "payload", data.encode())
+
+
+def output_static_error(err: StaticError, fmt: OutputFormat = OutputFormat.JSON) -> None:
+    """Output a StaticError; same result as output_error without re-encoding."""
+    if fmt == OutputFormat.JSON:
+        _write_bytes(sys.stderr, err.payload)
+    else:
+        error_console.print(f"[red]Error:[/red] {err.message}")
+
+
 def output_success(message: str, data: Any = None, fmt: OutputFormat = OutputFormat.JSON) -> None:
     """Output a success message."""
     if fmt == OutputFormat.JSON:
         result = {"status": "ok", "message": message}
         if data is not None:
-            result["data"] = _serialize(data)
-        print(json.dumps(result, indent=2, default=str))
+            result["data"] = data
+        _write_stdout(jsonio.dumps(result, indent=True, newline=True, default=_json_default))
     else:
         console.print(f"[green]✓[/green] {message}")
         if data is not None:
@@ -86,8 +161,10 @@ def output_projects_list(
     task_counts: optional dict of {project_id: {"open": N, "progress": N, "blocked": N}}
     """
     if fmt == OutputFormat.JSON:
-        output_json([_serialize(p) for p in projects])
+        output_json(projects)
     else:
+        from rich.table import Table
+
         if not projects:
             console.print("[dim]No projects found[/dim]")
             return
@@ -190,6 +267,8 @@ def output_task_detail(task: Any, fmt: OutputFormat = OutputFormat.JSON) -> None
     if fmt == OutputFormat.JSON:
         output_json(task.to_dict())
     else:
+        from rich.panel import Panel
+
         state_color = {
             "open": "white",
             "progress": "yellow",
@@ -215,6 +294,8 @@ def output_worklog_entries(entries: list[Any], fmt: OutputFormat = OutputFormat.
     if fmt == OutputFormat.JSON:
         output_json([e.to_dict() for e in entries])
     else:
+        from rich.text import Text
+
         if not entries:
             console.print("[dim]No log entries found[/dim]")
             return
@@ -249,11 +330,29 @@ def output_worklog_entries(entries: list[Any], fmt: OutputFormat = OutputFormat.
             console.print()
 
 
+def output_worklog_batch(entries: list[Any], fmt: OutputFormat = OutputFormat.JSON) -> None:
+    """Output entries as they arrive in follow mode, flushing once per batch.
+
+    Each entry is rendered as output_worklog_entries([entry]) would render it,
+    but the whole batch goes out in one write.
+    """
+    if fmt == OutputFormat.JSON:
+        data = b"".join(jsonio.dumps([e.to_dict()], indent=True, newline=True) for e in entries)
+        _write_stdout(data)
+        sys.stdout.flush()
+    else:
+        with console:  # buffer rich output until the batch is rendered
+            for entry in entries:
+                output_worklog_entries([entry], fmt=fmt)
+
+
 def output_research_list(items: list[Any], fmt: OutputFormat = OutputFormat.JSON) -> None:
     """Output a list of research items."""
     if fmt == OutputFormat.JSON:
         output_json([r.to_dict() for r in items])
     else:
+        from rich.table import Table
+
         if not items:
             console.print("[dim]No research items found[/dim]")
             return
@@ -288,6 +387,8 @@ def output_context(context: dict[str, Any], fmt: OutputFormat = OutputFormat.JSO
     if fmt == OutputFormat.JSON:
         output_json(context)
     else:
+        from rich.panel import Panel
+
         proj = context["project"]
         source = context.get("source", "")
         source_hint = f" [dim]({source})[/dim]" if source else ""
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
+from . import jsonio
 from .discovery import load_portfolio_config, discover_projects, get_project
 from .tasks import list_tasks, get_task, change_task_state
 from .worklog import add_entry, tail_entries
@@ -261,17 +262,12 @@ def create_app() -> FastAPI:
         config = load_portfolio_config()
         if not config:
             return {"error": "no_portfolio"}
-        import json
         from datetime import datetime, timezone
         try:
             project = get_project(config, req.project)
             if not project or not project.project_dir:
                 return {"success": False, "error": "project_not_found"}
 
-            agent_dir = project.project_dir / ".agent"
-            agent_dir.mkdir(exist_ok=True)
-            issues_file = agent_dir / "issues.jsonl"
-
             entry = {
                 "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 "type": req.type,
@@ -284,8 +280,9 @@ def create_app() -> FastAPI:
             }
             entry = {k: v for k, v in entry.items() if v is not None}
 
-            with open(issues_file, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            issues_file = project.issues_file
+            issues_file.parent.mkdir(exist_ok=True)
+            jsonio.append_jsonl(issues_file, entry)
 
             return {"success": True}
         except Exception as e:
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from collections.abc import Collection, Iterable, Iterator
 from datetime import date
+from operator import attrgetter
 from pathlib import Path
 
-import yaml
-
-from .models import Task, TaskState, TaskComplexity, PortfolioConfig
+from .models import Task, TaskState, TaskComplexity, PortfolioConfig, task_state_from_path
 from .discovery import get_project_dir
 
+# Sort key for task listings; attrgetter builds the tuple in C
+_PRIORITY_ORDER = attrgetter("priority", "id")
+
+_ACTIONABLE_STATES = (TaskState.OPEN, TaskState.PROGRESS)
+
 
 def get_tasks_dir(config: PortfolioConfig, project_id: str) -> Path | None:
     """Get the tasks directory for a project."""
@@ -22,64 +28,110 @@ def get_tasks_dir(config: PortfolioConfig, project_id: str) -> Path | None:
     return None
 
 
-def _scan_task_files(location: Path, tasks: list[Task], state_filter: TaskState | None) -> None:
-    """Scan a directory for task files (both .md files and task directories)."""
-    if not location.exists():
+def _iter_task_files(location: Path) -> Iterator[Path]:
+    """Yield task file paths in a directory (both .md files and task directories)."""
+    try:
+        with os.scandir(location) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError):
         return
 
-    for item in location.iterdir():
-        if item.is_file() and item.suffix == ".md":
+    for entry in entries:
+        if entry.is_file() and os.path.splitext(entry.name)[1] == ".md":
             # Regular task file
+            yield Path(entry.path)
+        elif entry.is_dir() and not entry.name.startswith(".") and entry.name not in ("done", "blocked"):
+            # Task directory - _task.md (parent) and subtasks
+            parent_file = Path(entry.path) / "_task.md"
+            if parent_file.exists():
+                yield parent_file
+
+            # The directory may be moved away (e.g. by a state change) mid-scan
             try:
-                task = Task.from_file(item)
-                if state_filter is None or task.state == state_filter:
-                    tasks.append(task)
-            except Exception:
+                with os.scandir(entry.path) as it:
+                    subs = [
+                        sub.path for sub in it
+                        if sub.name != "_task.md" and sub.name.endswith(".md") and sub.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-        elif item.is_dir() and not item.name.startswith(".") and item.name not in ("done", "blocked"):
-            # Task directory - check for _task.md (parent) and subtasks
-            parent_file = item / "_task.md"
-            if parent_file.exists():
-                try:
-                    parent_task = Task.from_file(parent_file)
-                    if state_filter is None or parent_task.state == state_filter:
-                        tasks.append(parent_task)
-                except Exception:
-                    continue
-
-            # Scan for subtasks in the directory
-            for subtask_file in item.glob("*.md"):
-                if subtask_file.name == "_task.md":
-                    continue
-                try:
-                    subtask = Task.from_file(subtask_file)
-                    if state_filter is None or subtask.state == state_filter:
-                        tasks.append(subtask)
-                except Exception:
-                    continue
+            for sub_path in subs:
+                yield Path(sub_path)
+
+
+def _scan_task_files(location: Path, tasks: list[Task], states: Collection[TaskState] | None) -> None:
+    """Scan a directory for task files (both .md files and task directories).
+
+    State comes from the file's location, so unwanted files are never parsed.
+    """
+    for path in _iter_task_files(location):
+        if states is not None and task_state_from_path(path) not in states:
+            continue
+        try:
+            task = Task.from_file(path)
+        except Exception:
+            continue
+        tasks.append(task)
+
+
+def count_tasks(
+    config: PortfolioConfig,
+    project_id: str,
+    states: Collection[TaskState] | None = None,
+) -> dict[TaskState, int]:
+    """Count a project's tasks by state without parsing task files.
+
+    State is derived from each file's location, exactly as Task.from_file
+    does. The done/ directory is only scanned when DONE counts are wanted.
+    """
+    counts = {state: 0 for state in TaskState}
+    tasks_dir = get_tasks_dir(config, project_id)
+    if not tasks_dir:
+        return counts
+
+    locations = [tasks_dir, tasks_dir / "blocked"]
+    if states is None or TaskState.DONE in states:
+        locations.append(tasks_dir / "done")
+
+    for location in locations:
+        for path in _iter_task_files(location):
+            counts[task_state_from_path(path)] += 1
+
+    return counts
 
 
 def list_tasks(
     config: PortfolioConfig,
     project_id: str,
-    state_filter: TaskState | None = None,
+    state_filter: TaskState | Collection[TaskState] | None = None,
 ) -> list[Task]:
-    """List all tasks for a project."""
+    """List all tasks for a project.
+
+    state_filter may be a single state or a collection of states; all
+    requested states are gathered in one scan.
+    """
     tasks_dir = get_tasks_dir(config, project_id)
     if not tasks_dir:
         return []
 
+    if isinstance(state_filter, TaskState):
+        states = frozenset((state_filter,))
+    elif state_filter is not None:
+        states = frozenset(state_filter)
+    else:
+        states = None
+
     tasks: list[Task] = []
 
     # Collect tasks from all locations
-    locations = [
-        tasks_dir,  # Main dir - open or progress
-        tasks_dir / "done",
-        tasks_dir / "blocked",
-    ]
+    locations = [tasks_dir]  # Main dir - open or progress
+    if states is None or TaskState.DONE in states:
+        locations.append(tasks_dir / "done")
+    if states is None or TaskState.BLOCKED in states:
+        locations.append(tasks_dir / "blocked")
 
     for location in locations:
-        _scan_task_files(location, tasks, state_filter)
+        _scan_task_files(location, tasks, states)
 
     # Build parent-child relationships
     task_map = {t.id: t for t in tasks}
@@ -90,7 +142,7 @@ def list_tasks(
                 parent.children.append(task.id)
 
     # Sort by priority (lower is higher), then by ID
-    tasks.sort(key=lambda t: (t.priority, t.id))
+    tasks.sort(key=_PRIORITY_ORDER)
 
     return tasks
 
@@ -153,16 +205,61 @@ def get_task(config: PortfolioConfig, project_id: str, task_id: str) -> Task | N
     return None
 
 
+def get_tasks_bulk(
+    config: PortfolioConfig,
+    project_id: str,
+    task_ids: Iterable[str],
+) -> dict[str, Task]:
+    """Load several tasks by ID with a single walk of the tasks tree.
+
+    Files are matched by name (ID.md, ID.progress.md or ID/_task.md) like
+    get_task, so only the requested tasks are parsed. Missing IDs are
+    absent from the result.
+    """
+    wanted = set(task_ids)
+    tasks_dir = get_tasks_dir(config, project_id)
+    if not tasks_dir or not wanted:
+        return {}
+
+    found: dict[str, Task] = {}
+    for location in (tasks_dir, tasks_dir / "done", tasks_dir / "blocked"):
+        for path in _iter_task_files(location):
+            if path.name == "_task.md":
+                file_id = path.parent.name
+            else:
+                file_id = path.name[:-len(".md")].removesuffix(".progress")
+            if file_id not in wanted or file_id in found:
+                continue
+            try:
+                found[file_id] = Task.from_file(path)
+            except Exception:
+                continue
+
+    return found
+
+
 def get_next_task(config: PortfolioConfig, project_id: str) -> Task | None:
     """Get the next task to work on (highest priority open task with satisfied dependencies)."""
-    tasks = list_tasks(config, project_id)
+    return select_next_task(list_tasks(config, project_id))
+
 
+def partition_tasks(tasks: Iterable[Task]) -> dict[TaskState, list[Task]]:
+    """Group tasks by state, keeping their order within each state."""
+    by_state: dict[TaskState, list[Task]] = {state: [] for state in TaskState}
+    append_to = {state: bucket.append for state, bucket in by_state.items()}
+    for task in tasks:
+        append_to[task.state](task)
+    return by_state
+
+
+def select_next_task(tasks: list[Task]) -> Task | None:
+    """Pick the next task from a full, priority-sorted list_tasks() result."""
     # Get IDs of completed tasks
     done_ids = {t.id for t in tasks if t.state == TaskState.DONE}
 
     # Find open tasks with satisfied dependencies
     for task in tasks:
-        if task.state not in (TaskState.OPEN, TaskState.PROGRESS):
+        if task.state not in _ACTIONABLE_STATES:
             continue
 
         # Check if all dependencies are satisfied
@@ -198,11 +295,11 @@ def change_task_state(
 
     # Check for incomplete subtasks when marking parent as done
     if new_state == TaskState.DONE and task.children and not force:
-        incomplete = []
-        for child_id in task.children:
-            child = get_task(config, project_id, child_id)
-            if child and child.state != TaskState.DONE:
-                incomplete.append(child_id)
+        children = get_tasks_bulk(config, project_id, task.children)
+        incomplete = [
+            child_id for child_id in task.children
+            if child_id in children and children[child_id].state != TaskState.DONE
+        ]
         if incomplete:
             # Return None to signal failure - caller should check and report
             return None
@@ -276,6 +373,8 @@ def add_task(
     description: str = "",
 ) -> Task | None:
     """Add a new task to a project."""
+    import yaml  # deferred: listing and counting tasks never need it
+
     tasks_dir = get_tasks_dir(config, project_id)
     if not tasks_dir:
         # Create tasks directory if project exists
@@ -360,6 +459,8 @@ def edit_task(
     body: str | None = None,
 ) -> Task | None:
     """Edit task metadata (frontmatter) and optionally title/body."""
+    import yaml
+
     task = get_task(config, project_id, task_id)
     if not task or not task.file_path:
         return None
@@ -468,6 +569,8 @@ def add_subtask(
     Auto-splits parent if not already a directory.
     Generates sequential subtask ID (PARENT-001, PARENT-002, etc.).
     """
+    import yaml
+
     tasks_dir = get_tasks_dir(config, project_id)
     if not tasks_dir:
         return None
@@ -0,0 +1,77 @@
+"""File change notification for ClawPM follow modes."""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import sys
+import time
+from pathlib import Path
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x002
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+
+
+class FileWatcher:
+    """Block until a file may have changed.
+
+    On Linux this waits on an inotify watch of the file's directory (so the
+    file may be created or replaced), costing no syscalls while idle. Elsewhere,
+    or if inotify is unavailable, it falls back to sleeping for ``interval``.
+    Wake-ups may be spurious; callers re-check the file themselves.
+    """
+
+    def __init__(self, path: Path, interval: float = 1.0) -> None:
+        self.path = path
+        self.interval = interval
+        self._fd: int | None = None
+        if sys.platform.startswith("linux"):
+            self._fd = self._open_inotify(path.parent)
+
+    @staticmethod
+    def _open_inotify(directory: Path) -> int | None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        mask = _IN_MODIFY | _IN_CREATE | _IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Return after a change notification, or after ``timeout`` seconds."""
+        if self._fd is None:
+            time.sleep(self.interval)
+            return
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if readable:
+            # Drain queued events; which file changed is not needed
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> FileWatcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
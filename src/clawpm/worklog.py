@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
+from . import jsonio
 from .models import PortfolioConfig, WorkLogEntry, WorkLogAction
 
 
@@ -45,16 +50,27 @@ def add_entry(
         commit_hash=commit_hash,
     )
 
+    append_entries(config, [entry])
+    return entry
+
+
+def append_entries(config: PortfolioConfig, entries: list[WorkLogEntry]) -> None:
+    """Append entries to the work log.
+
+    All lines are encoded first and written with one unbuffered append, so a
+    batch costs a single open/write/close however many entries it holds.
+    """
+    if not entries:
+        return
+    data = b"".join(jsonio.dumps(entry.to_dict(), newline=True) for entry in entries)
+
     worklog_path = get_worklog_path(config)
 
     # Ensure parent directory exists
     worklog_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Append to file
-    with open(worklog_path, "a") as f:
-        f.write(json.dumps(entry.to_dict()) + "\n")
-
-    return entry
+    with open(worklog_path, "ab", buffering=0) as f:
+        f.write(data)
 
 
 def read_entries(
@@ -68,8 +84,23 @@ def read_entries(
     if not worklog_path.exists():
         return []
 
-    entries: list[WorkLogEntry] = []
+    entries = _iter_entries(worklog_path, project)
 
+    # Most recent first. Timestamps need not follow file order (backdated
+    # commits, hosts with skewed clocks), so every entry is considered;
+    # with a limit only the newest ones are kept. nlargest is stable, like
+    # the full sort, so ties stay in file order either way.
+    if limit is not None and limit > 0:
+        return heapq.nlargest(limit, entries, key=attrgetter("ts"))
+
+    result = sorted(entries, key=attrgetter("ts"), reverse=True)
+    if limit is not None:
+        result = result[:limit]
+    return result
+
+
+def _iter_entries(worklog_path: Path, project: str | None) -> Iterator[WorkLogEntry]:
+    """Yield well-formed entries in file order, optionally for one project."""
     with open(worklog_path) as f:
         for line in f:
             line = line.strip()
@@ -79,24 +110,15 @@ def read_entries(
             try:
                 data = json.loads(line)
                 entry = WorkLogEntry.from_dict(data)
-
-                # Apply project filter
-                if project is not None and entry.project != project:
-                    continue
-
-                entries.append(entry)
             except (json.JSONDecodeError, KeyError, ValueError):
                 # Skip malformed entries
                 continue
 
-    # Sort by timestamp descending (most recent first)
-    entries.sort(key=lambda e: e.ts, reverse=True)
-
-    # Apply limit
-    if limit is not None:
-        entries = entries[:limit]
+            # Apply project filter
+            if project is not None and entry.project != project:
+                continue
 
-    return entries
+            yield entry
 
 
 def get_last_entry(
@@ -108,30 +130,96 @@ def get_last_entry(
     return entries[0] if entries else None
 
 
+def get_commit_index_path(config: PortfolioConfig) -> Path:
+    """Get the path of the logged-commit index that sits beside the work log."""
+    return config.portfolio_root / ".commit_index.json"
+
+
+# Bytes before the indexed offset kept in the index to detect rewritten logs
+_INDEX_CHECK_LEN = 64
+
+
+def _scan_commit_hashes(f, hashes: dict[str, set[str]]) -> int:
+    """Add commit hashes from complete lines at f's position; return the new offset."""
+    offset = f.tell()
+    for line in f:
+        # An unterminated last line is read but not indexed past, so it is
+        # scanned again once its writer finishes it
+        if line.endswith(b"\n"):
+            offset += len(line)
+        if b'"commit_hash"' not in line:
+            continue
+        try:
+            data = json.loads(line)
+            if data.get("action") == "commit" and data.get("commit_hash"):
+                hashes.setdefault(data.get("project") or "", set()).add(data["commit_hash"])
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            continue
+    return offset
+
+
+def _load_commit_index(index_path: Path, f) -> tuple[int, dict[str, set[str]]]:
+    """Load the index if it still describes a prefix of the open work log."""
+    try:
+        index = json.loads(index_path.read_bytes())
+        offset = index["offset"]
+        check = bytes.fromhex(index["check"])
+        hashes = {project: set(found) for project, found in index["hashes"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return 0, {}
+
+    f.seek(max(offset - len(check), 0))
+    if len(check) > offset or f.read(len(check)) != check:
+        return 0, {}
+    return offset, hashes
+
+
+def _save_commit_index(index_path: Path, f, offset: int, hashes: dict[str, set[str]]) -> None:
+    """Atomically write the index; failures only cost a rescan next time."""
+    f.seek(max(offset - _INDEX_CHECK_LEN, 0))
+    check = f.read(min(offset, _INDEX_CHECK_LEN))
+    index = {
+        "offset": offset,
+        "check": check.hex(),
+        "hashes": {project: sorted(found) for project, found in hashes.items()},
+    }
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass
+
+
 def get_logged_commit_hashes(
     config: PortfolioConfig,
     project: str | None = None,
+    save: bool = True,
 ) -> set[str]:
-    """Get set of commit hashes already logged (from commit_hash field)."""
+    """Get set of commit hashes already logged (from commit_hash field).
+
+    Hashes are kept in an index next to the work log together with the byte
+    offset they cover, so only entries appended since the last call are read.
+    The index is rebuilt if the log was truncated or rewritten. With
+    save=False an existing index is used but not written back.
+    """
     worklog_path = get_worklog_path(config)
-    if not worklog_path.exists():
+    index_path = get_commit_index_path(config)
+    try:
+        f = open(worklog_path, "rb")
+    except FileNotFoundError:
         return set()
 
-    hashes: set[str] = set()
-    with open(worklog_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                if data.get("action") == "commit" and data.get("commit_hash"):
-                    if project is None or data.get("project") == project:
-                        hashes.add(data["commit_hash"])
-            except (json.JSONDecodeError, KeyError):
-                continue
+    with f:
+        offset, hashes = _load_commit_index(index_path, f)
+        f.seek(offset)
+        new_offset = _scan_commit_hashes(f, hashes)
+        if save and (new_offset != offset or not index_path.exists()):
+            _save_commit_index(index_path, f, new_offset, hashes)
 
-    return hashes
+    if project is not None:
+        return set(hashes.get(project, ()))
+    return set().union(*hashes.values())
 
 
 def tail_entries(
@@ -0,0 +1,68 @@
+"""Tests for CLI helpers."""
+
+import click
+from click.testing import CliRunner
+
+from clawpm import cli
+
+
+class TestRequireProject:
+    """Test project resolution inside one CLI invocation."""
+
+    def test_nested_invoke_resolves_once(self, temp_portfolio, monkeypatch):
+        """Bare 'tasks' resolves the cwd project once, not per ctx.invoke."""
+        calls = []
+        real = cli.resolve_project
+
+        def counting(explicit=None):
+            calls.append(explicit)
+            return real(explicit)
+
+        monkeypatch.setattr(cli, "resolve_project", counting)
+        monkeypatch.chdir(temp_portfolio["project_dir"])
+
+        @cli.tasks.command("twice")
+        @click.pass_context
+        def twice(ctx):
+            assert cli.require_project(ctx, None) == ("test", "cwd")
+            assert cli.require_project(ctx, None) == ("test", "cwd")
+
+        try:
+            result = CliRunner().invoke(cli.main, ["tasks", "twice"])
+        finally:
+            cli.tasks.commands.pop("twice")
+
+        assert result.exit_code == 0, result.output
+        assert calls == [None]
+
+
+class TestIsFixedIssueLine:
+    """Test the raw-bytes fixed-issue pre-filter."""
+
+    def test_fixed_records(self):
+        """Compact and spaced top-level fixed: true are recognised."""
+        assert cli.is_fixed_issue_line(b'{"type":"bug","fixed":true}')
+        assert cli.is_fixed_issue_line(b'{"fixed": true, "type": "bug"}')
+
+    def test_left_for_full_parse(self):
+        """Open, nested or look-alike records are never reported fixed."""
+        assert not cli.is_fixed_issue_line(b'{"type":"bug","fixed":false}')
+        assert not cli.is_fixed_issue_line(b'{"meta":{"fixed":true},"fixed":false}')
+        assert not cli.is_fixed_issue_line(b'{"context":"\\"fixed\\": true","fixed":false}')
+        assert not cli.is_fixed_issue_line(b'{"actual":"was fixed","fixed":false}')
+
+
+class TestIssuesList:
+    """Test the issues list command."""
+
+    def test_malformed_line_writes_nothing(self, temp_portfolio, monkeypatch):
+        """A bad line fails the command before any JSON reaches stdout."""
+        issues_file = temp_portfolio["project_dir"] / ".agent" / "issues.jsonl"
+        issues_file.parent.mkdir(exist_ok=True)
+        issues_file.write_text('{"type":"bug","actual":"x"}\n{bad\n')
+        monkeypatch.chdir(temp_portfolio["project_dir"])
+
+        result = CliRunner().invoke(cli.main, ["issues", "list"])
+
+        assert result.exit_code != 0
+        assert result.stdout == ""
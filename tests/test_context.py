@@ -0,0 +1,92 @@
+"""Tests for project context detection."""
+
+from clawpm.context import (
+    clear_detect_cache,
+    cwd_in_project_roots,
+    detect_project_from_cwd,
+    expand_task_id,
+)
+
+
+class TestCwdInProjectRoots:
+    """Test the cheap cwd-under-project-root check."""
+
+    def test_inside_project_root(self, temp_portfolio, monkeypatch):
+        """A directory below a project root matches."""
+        monkeypatch.chdir(temp_portfolio["project_dir"])
+
+        assert cwd_in_project_roots(temp_portfolio["config"])
+
+    def test_project_root_itself(self, temp_portfolio, monkeypatch):
+        """The project root itself is not inside a project."""
+        monkeypatch.chdir(temp_portfolio["root"] / "projects")
+
+        assert not cwd_in_project_roots(temp_portfolio["config"])
+
+    def test_sibling_with_common_prefix(self, temp_portfolio, monkeypatch):
+        """A sibling directory sharing the root's name prefix does not match."""
+        sibling = temp_portfolio["root"] / "projects-old" / "repo"
+        sibling.mkdir(parents=True)
+        monkeypatch.chdir(sibling)
+
+        assert not cwd_in_project_roots(temp_portfolio["config"])
+
+
+class TestExpandTaskId:
+    """Test short task reference expansion."""
+
+    def test_expansions(self):
+        """Numeric, subtask and full references expand to full IDs."""
+        assert expand_task_id("22", "clawpm") == "CLAWP-022"
+        assert expand_task_id("4-1", "clawpm") == "CLAWP-004-001"
+        assert expand_task_id("clawp-022", "clawpm") == "CLAWP-022"
+        assert expand_task_id("notes", "clawpm") == "notes"
+
+    def test_repeated_lookup_is_cached(self):
+        """A repeated (ref, project) pair is served from the cache."""
+        expand_task_id.cache_clear()
+        expand_task_id("7", "my-project")
+        expand_task_id("7", "my-project")
+
+        assert expand_task_id.cache_info().hits == 1
+
+
+class TestDetectProjectFromCwd:
+    """Test the per-cwd project detection cache."""
+
+    def test_new_project_found_after_miss(self, temp_portfolio, monkeypatch):
+        """A miss is not cached; a project created afterwards is detected."""
+        clear_detect_cache()
+        other = temp_portfolio["root"] / "projects" / "other"
+        other.mkdir()
+        monkeypatch.chdir(other)
+
+        assert detect_project_from_cwd() is None
+
+        (other / ".project").mkdir()
+        (other / ".project" / "settings.toml").write_text('id = "other"\nname = "Other"\n')
+        assert detect_project_from_cwd().id == "other"
+
+    def test_nearer_project_takes_precedence(self, temp_portfolio, monkeypatch):
+        """A project created in cwd below a cached ancestor project is found."""
+        clear_detect_cache()
+        sub = temp_portfolio["project_dir"] / "sub"
+        sub.mkdir()
+        monkeypatch.chdir(sub)
+
+        assert detect_project_from_cwd().id == "test"
+
+        (sub / ".project").mkdir()
+        (sub / ".project" / "settings.toml").write_text('id = "sub"\nname = "Sub"\n')
+        assert detect_project_from_cwd().id == "sub"
+
+    def test_settings_edits_seen_while_cached(self, temp_portfolio, monkeypatch):
+        """Only the settings path is cached; edited settings are reloaded."""
+        clear_detect_cache()
+        settings_file = temp_portfolio["project_dir"] / ".project" / "settings.toml"
+        monkeypatch.chdir(temp_portfolio["project_dir"])
+
+        first = detect_project_from_cwd()
+        settings_file.write_text(settings_file.read_text().replace(first.name, "Renamed project"))
+
+        assert detect_project_from_cwd().name == "Renamed project"
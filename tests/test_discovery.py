@@ -0,0 +1,184 @@
+"""Tests for portfolio and project discovery."""
+
+from clawpm import discovery, jsonio
+from clawpm.discovery import (
+    discover_projects,
+    discover_untracked_repos,
+    get_project,
+    init_project_from_repo,
+    load_portfolio_config,
+    load_project_settings,
+    record_project,
+)
+from clawpm.models import ProjectStatus
+
+
+class TestPortfolioConfigCache:
+    """Test memoization of portfolio.toml parsing."""
+
+    def test_repeated_load_returns_cached_config(self, temp_portfolio):
+        """Loading an unchanged portfolio twice reuses the parsed config."""
+        root = temp_portfolio["root"]
+
+        first = load_portfolio_config(root)
+        second = load_portfolio_config(root)
+
+        assert first is second
+
+    def test_edit_invalidates_cache(self, temp_portfolio):
+        """Rewriting portfolio.toml produces a fresh config."""
+        root = temp_portfolio["root"]
+        first = load_portfolio_config(root)
+
+        (root / "portfolio.toml").write_text(f'''
+portfolio_root = "{root}"
+project_roots = ["{root}/projects", "{root}/more"]
+''')
+        second = load_portfolio_config(root)
+
+        assert second is not first
+        assert len(second.project_roots) == 2
+
+    def test_env_project_roots_invalidate_cache(self, temp_portfolio, monkeypatch):
+        """Changing CLAWPM_PROJECT_ROOTS is reflected in the loaded config."""
+        root = temp_portfolio["root"]
+        load_portfolio_config(root)
+
+        monkeypatch.setenv("CLAWPM_PROJECT_ROOTS", str(root / "extra"))
+        config = load_portfolio_config(root)
+
+        assert root / "extra" in config.project_roots
+
+
+class TestDiscoverProjectsStatusFilter:
+    """Test filtering projects by status."""
+
+    def test_matches_parsed_status(self, temp_portfolio):
+        """Peeked and parsed statuses filter the same way."""
+        projects = temp_portfolio["root"] / "projects"
+        settings = {
+            "paused": 'id = "paused"\nstatus = "paused"\n',
+            "default": 'id = "default"\n',
+            "nested": 'id = "nested"\n[extra]\nstatus = "paused"\n',
+            "multiline": 'id = "multiline"\nnotes = """\nstatus = "paused"\n"""\n',
+        }
+        for name, text in settings.items():
+            (projects / name / ".project").mkdir(parents=True)
+            (projects / name / ".project" / "settings.toml").write_text(text)
+
+        config = temp_portfolio["config"]
+        for status in ProjectStatus:
+            expected = {p.id for p in discover_projects(config) if p.status == status}
+            assert {p.id for p in discover_projects(config, status_filter=status)} == expected
+        assert {p.id for p in discover_projects(config, status_filter=ProjectStatus.ACTIVE)} == {
+            "test", "default", "nested", "multiline"
+        }
+
+
+class TestProjectSettingsCache:
+    """Test memoization of settings.toml parsing."""
+
+    def test_reused_until_edited(self, temp_portfolio):
+        """Unchanged settings are parsed once; an edit is picked up."""
+        settings_file = temp_portfolio["project_dir"] / ".project" / "settings.toml"
+
+        discovery._load_settings_file.cache_clear()
+        first = load_project_settings(settings_file)
+        assert get_project(temp_portfolio["config"], "test") == first
+        assert discovery._load_settings_file.cache_info().misses == 1
+
+        settings_file.write_text('id = "test"\nname = "Renamed Project"\n')
+        second = load_project_settings(settings_file)
+
+        assert second.name == "Renamed Project"
+
+    def test_callers_get_independent_copies(self, temp_portfolio):
+        """Mutating a loaded project does not affect later loads."""
+        settings_file = temp_portfolio["project_dir"] / ".project" / "settings.toml"
+
+        first = load_project_settings(settings_file)
+        first.labels.append("mutated")
+        first.name = "Mutated"
+        second = load_project_settings(settings_file)
+
+        assert "mutated" not in second.labels
+        assert second.name != "Mutated"
+
+
+class TestProjectIndex:
+    """Test get_project lookups through index.jsonl."""
+
+    def _make_project(self, temp_portfolio, dirname, project_id):
+        meta = temp_portfolio["root"] / "projects" / dirname / ".project"
+        meta.mkdir(parents=True)
+        (meta / "settings.toml").write_text(f'id = "{project_id}"\n')
+        return meta.parent
+
+    def test_indexed_project_found_without_scan(self, temp_portfolio, monkeypatch):
+        """A recorded project is loaded directly, with the same result as a scan."""
+        config = temp_portfolio["config"]
+        project_dir = self._make_project(temp_portfolio, "Some_Repo", "some-repo")
+        scanned = get_project(config, "some-repo")
+
+        record_project(config, "some-repo", project_dir)
+        monkeypatch.setattr(discovery, "_iter_settings_files", lambda root: iter(()))
+
+        assert get_project(config, "some-repo") == scanned
+
+    def test_stale_entry_falls_back_to_scan(self, temp_portfolio):
+        """An index entry pointing at the wrong directory is ignored."""
+        config = temp_portfolio["config"]
+        self._make_project(temp_portfolio, "moved", "moved-id")
+        record_project(config, "moved-id", temp_portfolio["project_dir"])
+
+        assert get_project(config, "moved-id").project_dir.name == "moved"
+
+
+class TestDiscoverUntrackedRepos:
+    """Test listing git repos that have no .project/ yet."""
+
+    def test_symlinks_and_tracked_projects(self, temp_portfolio):
+        """Symlinked repos are listed; links to tracked projects are not."""
+        projects = temp_portfolio["root"] / "projects"
+        (temp_portfolio["project_dir"] / ".git").mkdir()
+        (projects / "repo" / ".git").mkdir(parents=True)
+        (projects / "plain").mkdir()
+        outside = temp_portfolio["root"] / "outside"
+        (outside / ".git").mkdir(parents=True)
+        (projects / "linked-repo").symlink_to(outside)
+        (projects / "linked-project").symlink_to(temp_portfolio["project_dir"])
+
+        repos = discover_untracked_repos(temp_portfolio["config"])
+
+        assert [r.name for r in repos] == ["linked-repo", "repo"]
+
+
+class TestInitProjectFromRepo:
+    """Test auto-initializing .project/ in an untracked repo."""
+
+    def test_special_characters_round_trip(self, temp_portfolio):
+        """Quotes and backslashes in the directory name produce valid TOML."""
+        repo = temp_portfolio["root"] / "projects" / 'odd "name" \\ repo'
+        (repo / ".git").mkdir(parents=True)
+
+        settings = init_project_from_repo(repo)
+
+        assert settings is not None
+        assert settings.name == repo.name
+        assert settings.id == 'odd-"name"-\\-repo'
+        assert settings.repo_path == repo
+
+    def test_recorded_only_with_config(self, temp_portfolio):
+        """The new project is added to the given config's index, and only then."""
+        config = temp_portfolio["config"]
+        index = discovery.get_project_index_path(config)
+        first = temp_portfolio["root"] / "projects" / "first"
+        second = temp_portfolio["root"] / "projects" / "second"
+        first.mkdir()
+        second.mkdir()
+
+        init_project_from_repo(first)
+        assert not index.exists()
+
+        init_project_from_repo(second, config=config)
+        assert [jsonio.loads(line)["id"] for line in index.read_bytes().splitlines()] == ["second"]
@@ -0,0 +1,165 @@
+"""Tests for git helpers."""
+
+import subprocess
+
+import pytest
+
+from clawpm.git import (
+    _parse_origin_url,
+    get_changed_files,
+    get_commit_files,
+    get_diff_files,
+    get_remote_url,
+    get_repo_summary,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a git repo with one commit."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("a\n")
+    (tmp_path / "b.txt").write_text("b\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestChangedFiles:
+    """Test detection of uncommitted changes."""
+
+    def test_clean_repo(self, git_repo):
+        """A clean checkout reports no changes."""
+        assert get_changed_files(git_repo) is None
+
+    def test_staged_and_unstaged(self, git_repo):
+        """Both staged and unstaged edits are listed; untracked files are not."""
+        (git_repo / "a.txt").write_text("changed\n")
+        (git_repo / "b.txt").write_text("staged\n")
+        _git(git_repo, "add", "b.txt")
+        (git_repo / "new.txt").write_text("untracked\n")
+
+        assert get_changed_files(git_repo) == ["a.txt", "b.txt"]
+
+    def test_rename_reports_new_path(self, git_repo):
+        """A staged rename is reported once, under its new name."""
+        _git(git_repo, "mv", "a.txt", "renamed.txt")
+
+        assert get_changed_files(git_repo) == ["renamed.txt"]
+
+    def test_not_a_repo(self, tmp_path):
+        """Paths outside a git repo yield None."""
+        assert get_changed_files(tmp_path) is None
+
+
+class TestDiffFiles:
+    """Test listing files that differ from HEAD."""
+
+    def test_newline_in_filename(self, git_repo):
+        """Names with embedded newlines are returned intact."""
+        odd = git_repo / "odd\nname.txt"
+        odd.write_text("x\n")
+        _git(git_repo, "add", odd.name)
+        (git_repo / "a.txt").write_text("changed\n")
+
+        assert get_diff_files(git_repo) == ["a.txt", "odd\nname.txt"]
+
+    def test_clean_repo(self, git_repo):
+        """No differences yields None."""
+        assert get_diff_files(git_repo) is None
+
+
+class TestRepoSummary:
+    """Test the combined branch/status/log summary."""
+
+    def test_matches_individual_commands(self, git_repo):
+        """Branch, changes and commits agree with the separate git commands."""
+        (git_repo / "a.txt").write_text("changed\n")
+        (git_repo / "new.txt").write_text("untracked\n")
+
+        def run(*args):
+            return subprocess.run(
+                ["git", *args], cwd=git_repo, capture_output=True, text=True, check=True
+            ).stdout
+
+        summary = get_repo_summary(git_repo)
+
+        assert summary["branch"] == run("rev-parse", "--abbrev-ref", "HEAD").strip()
+        assert summary["changes"] == run("status", "--porcelain").strip().split("\n")
+        assert summary["recent_commits"] == run("log", "--oneline", "-3").strip().split("\n")
+
+    def test_detached_head(self, git_repo):
+        """A detached HEAD reports 'HEAD', like rev-parse --abbrev-ref."""
+        _git(git_repo, "checkout", "-q", "--detach")
+
+        assert get_repo_summary(git_repo)["branch"] == "HEAD"
+
+    def test_unborn_branch(self, tmp_path):
+        """A repo without commits has no branch or commits, but reports changes."""
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "a.txt").write_text("a\n")
+
+        summary = get_repo_summary(tmp_path)
+
+        assert "branch" not in summary
+        assert "recent_commits" not in summary
+        assert summary["changes"] == ["?? a.txt"]
+
+
+class TestCommitFiles:
+    """Test batched per-commit file listing."""
+
+    def test_matches_diff_tree(self, git_repo):
+        """Each commit's files match git diff-tree --name-status -r."""
+        (git_repo / "a.txt").write_text("changed\n")
+        (git_repo / "c.txt").write_text("c\n")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "edit")
+        _git(git_repo, "mv", "b.txt", "moved.txt")
+        _git(git_repo, "rm", "-q", "c.txt")
+        _git(git_repo, "commit", "-q", "-m", "move")
+
+        hashes = subprocess.run(
+            ["git", "log", "--format=%H"], cwd=git_repo, capture_output=True, text=True
+        ).stdout.split()
+        files = get_commit_files(git_repo, limit=10)
+
+        for commit_hash in hashes:
+            expected = subprocess.run(
+                ["git", "diff-tree", "--no-commit-id", "--name-status", "-r", commit_hash],
+                cwd=git_repo, capture_output=True, text=True,
+            ).stdout.split("\n")
+            assert files.get(commit_hash, []) == [line for line in expected if line]
+        assert hashes[-1] not in files  # root commit
+
+
+class TestRemoteUrl:
+    """Test reading the origin URL without running git."""
+
+    def _git_url(self, repo):
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"], cwd=repo, capture_output=True, text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def test_matches_git(self, git_repo):
+        """Plain configs, with and without an origin, agree with git."""
+        assert get_remote_url(git_repo) is None
+        _git(git_repo, "remote", "add", "origin", "git@example.com:user/repo.git")
+        _git(git_repo, "remote", "add", "upstream", "https://example.com/other.git")
+
+        assert get_remote_url(git_repo) == self._git_url(git_repo) == "git@example.com:user/repo.git"
+
+    def test_url_rewrite_uses_git(self, git_repo):
+        """insteadOf rules are applied, as git remote get-url does."""
+        _git(git_repo, "remote", "add", "origin", "gh:user/repo.git")
+        _git(git_repo, "config", "url.https://github.com/.insteadOf", "gh:")
+
+        assert _parse_origin_url((git_repo / ".git" / "config").read_text())[0] is False
+        assert get_remote_url(git_repo) == self._git_url(git_repo) == "https://github.com/user/repo.git"
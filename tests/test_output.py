@@ -0,0 +1,100 @@
+"""Tests for JSON output."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from clawpm import jsonio
+from clawpm.models import Task, TaskState
+from clawpm.output import (
+    StaticError,
+    _serialize,
+    output_error,
+    output_json,
+    output_static_error,
+)
+
+
+SAMPLE = {
+    "id": "TEST-001",
+    "title": "Café ☕",
+    "created": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    "path": Path("/tmp/x"),
+    "tags": [],
+    "meta": {},
+    "priority": 3,
+    "ratio": 0.5,
+    "done": None,
+}
+
+
+class TestJsonDumps:
+    """Test the JSON encoder matches the stdlib formatting."""
+
+    def test_pretty_matches_stdlib(self):
+        """Indented output equals json.dumps(indent=2, default=str)."""
+        expected = json.dumps(SAMPLE, indent=2, default=str, ensure_ascii=False)
+        assert jsonio.dumps(SAMPLE, indent=True) == expected.encode()
+
+    def test_newline_and_roundtrip(self):
+        """A trailing newline is appended on request and output parses back."""
+        data = jsonio.dumps(SAMPLE, newline=True)
+        assert data.endswith(b"\n")
+        assert jsonio.loads(data)["title"] == "Café ☕"
+
+    def test_non_ascii_written_unescaped(self, capsys):
+        """Non-ASCII text is emitted as UTF-8, not \\u escapes, with or without orjson."""
+        assert jsonio.dumps({"title": "é"}) == '{"title":"é"}'.encode()
+
+        output_json({"title": "Café ☕"})
+
+        assert capsys.readouterr().out == '{\n  "title": "Café ☕"\n}\n'
+
+
+class TestAppendJsonl:
+    """Test appending JSONL records."""
+
+    def test_appends_one_line_per_record(self, tmp_path):
+        """Each record is appended as its own JSON line."""
+        path = tmp_path / "issues.jsonl"
+        records = [{"type": "bug", "fixed": False}, {"actual": "Café"}]
+
+        for record in records:
+            jsonio.append_jsonl(path, record)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == records
+
+
+class TestOutputJson:
+    """Test output_json writes UTF-8 JSON to stdout."""
+
+    def test_writes_to_stdout(self, capsys):
+        """Output is a single JSON document followed by a newline."""
+        output_json({"a": [1, 2]})
+        out = capsys.readouterr().out
+        assert json.loads(out) == {"a": [1, 2]}
+        assert out.endswith("}\n")
+
+    def test_objects_match_serialize(self, capsys):
+        """Nested models encode the same as pre-serializing with _serialize."""
+        task = Task(id="TEST-001", title="Café", state=TaskState.OPEN, priority=2)
+        data = {"tasks": [task], "state": TaskState.PROGRESS, "path": Path("/tmp/x")}
+
+        output_json(data)
+
+        expected = json.dumps(_serialize(data), indent=2, default=str, ensure_ascii=False)
+        assert capsys.readouterr().out == expected + "\n"
+
+
+class TestStaticError:
+    """Test pre-encoded errors match output_error."""
+
+    def test_same_bytes_as_output_error(self, capsys):
+        """A StaticError writes exactly what output_error writes."""
+        output_error("no_project", "Pick a 'project'.")
+        expected = capsys.readouterr().err
+
+        output_static_error(StaticError("no_project", "Pick a 'project'."))
+
+        assert capsys.readouterr().err == expected
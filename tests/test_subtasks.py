@@ -1,8 +1,5 @@
 """Tests for subtask functionality."""
 
-import os
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -12,63 +9,6 @@ from clawpm.models import PortfolioConfig, TaskState
 from clawpm.tasks import list_tasks, get_task, add_task, change_task_state
 
 
-@pytest.fixture
-def temp_portfolio():
-    """Create a temporary portfolio with a test project."""
-    temp_dir = tempfile.mkdtemp(prefix="clawpm_test_")
-    portfolio_root = Path(temp_dir)
-    
-    # Create portfolio structure
-    (portfolio_root / "portfolio.toml").write_text(f'''
-portfolio_root = "{portfolio_root}"
-project_roots = ["{portfolio_root}/projects"]
-
-[defaults]
-status = "active"
-''')
-    
-    # Create projects directory
-    projects_dir = portfolio_root / "projects"
-    projects_dir.mkdir()
-    
-    # Create a test project
-    project_dir = projects_dir / "test-project"
-    project_dir.mkdir()
-    project_meta = project_dir / ".project"
-    project_meta.mkdir()
-    
-    (project_meta / "settings.toml").write_text('''
-id = "test"
-name = "Test Project"
-status = "active"
-priority = 3
-''')
-    
-    # Create tasks directory
-    tasks_dir = project_meta / "tasks"
-    tasks_dir.mkdir()
-    (tasks_dir / "done").mkdir()
-    (tasks_dir / "blocked").mkdir()
-    
-    # Set environment variable to use this portfolio
-    old_env = os.environ.get("CLAWPM_PORTFOLIO")
-    os.environ["CLAWPM_PORTFOLIO"] = str(portfolio_root)
-    
-    yield {
-        "root": portfolio_root,
-        "project_dir": project_dir,
-        "tasks_dir": tasks_dir,
-        "config": load_portfolio_config(portfolio_root),
-    }
-    
-    # Cleanup
-    if old_env:
-        os.environ["CLAWPM_PORTFOLIO"] = old_env
-    else:
-        os.environ.pop("CLAWPM_PORTFOLIO", None)
-    shutil.rmtree(temp_dir)
-
-
 class TestTaskBasics:
     """Test basic task operations."""
     
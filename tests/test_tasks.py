@@ -0,0 +1,163 @@
+"""Tests for task listing and counting."""
+
+import shutil
+
+from clawpm.models import TaskState
+from clawpm.tasks import (
+    _iter_task_files,
+    add_task,
+    add_subtask,
+    change_task_state,
+    count_tasks,
+    get_next_task,
+    get_task,
+    get_tasks_bulk,
+    list_tasks,
+    partition_tasks,
+    select_next_task,
+)
+
+
+class TestCountTasks:
+    """Test counting tasks by state without parsing them."""
+
+    def test_counts_match_list_tasks(self, temp_portfolio):
+        """Counts agree with the states list_tasks reports."""
+        config = temp_portfolio["config"]
+
+        parent = add_task(config, "test", "Parent")
+        add_subtask(config, "test", parent.id, "Child one")
+        add_subtask(config, "test", parent.id, "Child two")
+        t1 = add_task(config, "test", "In progress")
+        t2 = add_task(config, "test", "Blocked")
+        t3 = add_task(config, "test", "Done")
+        change_task_state(config, "test", t1.id, TaskState.PROGRESS)
+        change_task_state(config, "test", t2.id, TaskState.BLOCKED)
+        change_task_state(config, "test", t3.id, TaskState.DONE)
+
+        counts = count_tasks(config, "test")
+
+        for state in TaskState:
+            expected = len(list_tasks(config, "test", state_filter=state))
+            assert counts[state] == expected
+        assert counts[TaskState.OPEN] == 3
+
+    def test_skips_done_when_not_requested(self, temp_portfolio):
+        """Done tasks are not counted unless DONE is among the wanted states."""
+        config = temp_portfolio["config"]
+
+        task = add_task(config, "test", "Finished")
+        change_task_state(config, "test", task.id, TaskState.DONE)
+
+        counts = count_tasks(config, "test", states=(TaskState.OPEN,))
+
+        assert counts[TaskState.DONE] == 0
+
+    def test_unknown_project(self, temp_portfolio):
+        """An unknown project has zero tasks in every state."""
+        counts = count_tasks(temp_portfolio["config"], "missing")
+
+        assert all(n == 0 for n in counts.values())
+
+
+class TestGetTasksBulk:
+    """Test loading several tasks in one walk."""
+
+    def test_loads_requested_tasks_across_locations(self, temp_portfolio):
+        """Tasks are found in open, progress, done and subtask locations."""
+        config = temp_portfolio["config"]
+
+        parent = add_task(config, "test", "Parent")
+        child = add_subtask(config, "test", parent.id, "Child")
+        started = add_task(config, "test", "Started")
+        finished = add_task(config, "test", "Finished")
+        add_task(config, "test", "Not requested")
+        change_task_state(config, "test", started.id, TaskState.PROGRESS)
+        change_task_state(config, "test", finished.id, TaskState.DONE)
+
+        wanted = [parent.id, child.id, started.id, finished.id, "TEST-999"]
+        found = get_tasks_bulk(config, "test", wanted)
+
+        assert set(found) == {parent.id, child.id, started.id, finished.id}
+        for task_id, task in found.items():
+            assert task.state == get_task(config, "test", task_id).state
+
+
+class TestListTasksMultiState:
+    """Test listing several states in one scan."""
+
+    def test_matches_per_state_union(self, temp_portfolio):
+        """A state collection returns the union of the single-state listings."""
+        config = temp_portfolio["config"]
+
+        add_task(config, "test", "Open")
+        t1 = add_task(config, "test", "Started")
+        t2 = add_task(config, "test", "Stuck")
+        t3 = add_task(config, "test", "Finished")
+        change_task_state(config, "test", t1.id, TaskState.PROGRESS)
+        change_task_state(config, "test", t2.id, TaskState.BLOCKED)
+        change_task_state(config, "test", t3.id, TaskState.DONE)
+
+        wanted = (TaskState.OPEN, TaskState.PROGRESS, TaskState.BLOCKED)
+        combined = list_tasks(config, "test", state_filter=frozenset(wanted))
+        separate = [t for s in wanted for t in list_tasks(config, "test", state_filter=s)]
+
+        assert {t.id for t in combined} == {t.id for t in separate}
+        assert combined == sorted(combined, key=lambda t: (t.priority, t.id))
+        assert t3.id not in {t.id for t in combined}
+
+    def test_children_across_states(self, temp_portfolio):
+        """A started subtask is still listed as a child of its open parent."""
+        config = temp_portfolio["config"]
+
+        parent = add_task(config, "test", "Parent")
+        child = add_subtask(config, "test", parent.id, "Child")
+        change_task_state(config, "test", child.id, TaskState.PROGRESS)
+
+        tasks = list_tasks(config, "test", state_filter={TaskState.OPEN, TaskState.PROGRESS})
+        by_id = {t.id: t for t in tasks}
+
+        assert by_id[parent.id].children == [child.id]
+
+
+class TestPartitionAndNext:
+    """Test deriving per-state lists and the next task from one scan."""
+
+    def test_matches_separate_queries(self, temp_portfolio):
+        """Partitioned lists and next task agree with the per-state queries."""
+        config = temp_portfolio["config"]
+
+        dep = add_task(config, "test", "Dependency", priority=1)
+        add_task(config, "test", "Waits on dependency", priority=1, depends=[dep.id])
+        add_task(config, "test", "Ready", priority=4)
+        started = add_task(config, "test", "Started", priority=6)
+        stuck = add_task(config, "test", "Stuck")
+        change_task_state(config, "test", started.id, TaskState.PROGRESS)
+        change_task_state(config, "test", stuck.id, TaskState.BLOCKED)
+
+        all_tasks = list_tasks(config, "test")
+        by_state = partition_tasks(all_tasks)
+
+        for state in TaskState:
+            expected = list_tasks(config, "test", state_filter=state)
+            assert [t.id for t in by_state[state]] == [t.id for t in expected]
+        assert select_next_task(all_tasks).id == get_next_task(config, "test").id == dep.id
+
+
+class TestIterTaskFiles:
+    """Test walking a tasks directory."""
+
+    def test_task_dir_removed_mid_scan(self, temp_portfolio):
+        """A task directory that disappears during the walk is skipped."""
+        tasks_dir = temp_portfolio["tasks_dir"]
+        for name in ("TEST-001", "TEST-002"):
+            (tasks_dir / name).mkdir()
+            (tasks_dir / name / f"{name}-001.md").write_text("# Sub\n")
+
+        walk = _iter_task_files(tasks_dir)
+        first = next(walk)
+        for name in ("TEST-001", "TEST-002"):
+            shutil.rmtree(tasks_dir / name)
+
+        assert list(walk) == []
+        assert first.name.endswith("-001.md")
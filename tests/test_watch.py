@@ -0,0 +1,47 @@
+"""Tests for file change notification."""
+
+import threading
+import time
+
+from clawpm.watch import FileWatcher
+
+
+class TestFileWatcher:
+    """Test waking on file changes."""
+
+    def test_wakes_on_append(self, tmp_path):
+        """An append wakes the watcher well before the timeout."""
+        target = tmp_path / "work_log.jsonl"
+        target.write_text("")
+
+        with FileWatcher(target) as watcher:
+            timer = threading.Timer(0.1, lambda: target.open("a").write("x\n"))
+            timer.start()
+            start = time.monotonic()
+            watcher.wait(timeout=5)
+            elapsed = time.monotonic() - start
+            timer.join()
+
+        assert elapsed < 2
+
+    def test_wakes_on_create(self, tmp_path):
+        """Creating a missing file also wakes the watcher."""
+        target = tmp_path / "work_log.jsonl"
+
+        with FileWatcher(target) as watcher:
+            timer = threading.Timer(0.1, target.touch)
+            timer.start()
+            start = time.monotonic()
+            watcher.wait(timeout=5)
+            elapsed = time.monotonic() - start
+            timer.join()
+
+        assert elapsed < 2
+
+    def test_timeout_without_changes(self, tmp_path):
+        """With no changes, wait returns after the timeout."""
+        with FileWatcher(tmp_path / "work_log.jsonl", interval=0.05) as watcher:
+            start = time.monotonic()
+            watcher.wait(timeout=0.05)
+
+        assert time.monotonic() - start < 1
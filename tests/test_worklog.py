@@ -0,0 +1,136 @@
+"""Tests for work log operations."""
+
+from datetime import datetime, timedelta, timezone
+
+from clawpm import jsonio
+from clawpm.models import WorkLogAction, WorkLogEntry
+from clawpm.worklog import (
+    add_entry,
+    append_entries,
+    get_commit_index_path,
+    get_logged_commit_hashes,
+    get_worklog_path,
+    read_entries,
+)
+
+
+def _commit(config, project, commit_hash):
+    add_entry(config, project=project, action=WorkLogAction.COMMIT, commit_hash=commit_hash)
+
+
+class TestLoggedCommitHashes:
+    """Test the incremental logged-commit index."""
+
+    def test_filters_by_project(self, temp_portfolio):
+        """Hashes are returned per project, or all together."""
+        config = temp_portfolio["config"]
+        _commit(config, "test", "aaa")
+        _commit(config, "other", "bbb")
+        add_entry(config, project="test", action=WorkLogAction.NOTE, summary="not a commit")
+
+        assert get_logged_commit_hashes(config, project="test") == {"aaa"}
+        assert get_logged_commit_hashes(config) == {"aaa", "bbb"}
+
+    def test_picks_up_appended_entries(self, temp_portfolio):
+        """Entries appended after the index was written are found."""
+        config = temp_portfolio["config"]
+        _commit(config, "test", "aaa")
+        get_logged_commit_hashes(config, project="test")
+        assert get_commit_index_path(config).exists()
+
+        _commit(config, "test", "bbb")
+
+        assert get_logged_commit_hashes(config, project="test") == {"aaa", "bbb"}
+
+    def test_save_false_leaves_no_index(self, temp_portfolio):
+        """A read with save=False (as for --dry-run) writes nothing."""
+        config = temp_portfolio["config"]
+        _commit(config, "test", "aaa")
+
+        assert get_logged_commit_hashes(config, project="test", save=False) == {"aaa"}
+        assert not get_commit_index_path(config).exists()
+
+    def test_rewritten_log_rebuilds_index(self, temp_portfolio):
+        """Replacing the work log invalidates the index."""
+        config = temp_portfolio["config"]
+        _commit(config, "test", "aaa")
+        _commit(config, "test", "bbb")
+        get_logged_commit_hashes(config, project="test")
+
+        worklog = get_worklog_path(config)
+        first_line = worklog.read_text().splitlines(keepends=True)[0]
+        worklog.write_text(first_line)
+
+        assert get_logged_commit_hashes(config, project="test") == {"aaa"}
+
+    def test_unterminated_last_line(self, temp_portfolio):
+        """A final line without a newline is still counted."""
+        config = temp_portfolio["config"]
+        _commit(config, "test", "aaa")
+        worklog = get_worklog_path(config)
+        with open(worklog, "a") as f:
+            f.write('{"project": "test", "action": "commit", "commit_hash": "bbb"}')
+
+        assert get_logged_commit_hashes(config, project="test") == {"aaa", "bbb"}
+        assert get_logged_commit_hashes(config, project="test") == {"aaa", "bbb"}
+
+
+class TestAppendEntries:
+    """Test appending a batch of entries in one write."""
+
+    def test_batch_matches_single_appends(self, temp_portfolio):
+        """A batch reads back in order, like the same entries added one by one."""
+        config = temp_portfolio["config"]
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        entries = [
+            WorkLogEntry(ts=ts + timedelta(minutes=i), project="test", action=WorkLogAction.COMMIT, commit_hash=h)
+            for i, h in enumerate(["aaa", "bbb"])
+        ]
+        append_entries(config, entries)
+        append_entries(config, [])
+
+        assert [e.to_dict() for e in read_entries(config)] == [e.to_dict() for e in reversed(entries)]
+        assert get_logged_commit_hashes(config, project="test") == {"aaa", "bbb"}
+
+    def test_same_encoding_as_append_jsonl(self, temp_portfolio, tmp_path):
+        """Work log lines are encoded exactly like other JSONL files."""
+        config = temp_portfolio["config"]
+        entry = add_entry(config, project="test", action=WorkLogAction.NOTE, summary="Café")
+
+        jsonio.append_jsonl(tmp_path / "other.jsonl", entry.to_dict())
+
+        assert get_worklog_path(config).read_bytes() == (tmp_path / "other.jsonl").read_bytes()
+
+
+class TestReadNewestEntries:
+    """Test that limited reads match a full read."""
+
+    def test_matches_full_read_with_backdated_commits(self, temp_portfolio):
+        """Backdated commit entries give the same result as the full read."""
+        config = temp_portfolio["config"]
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(40):
+            project = "test" if i % 3 else "other"
+            add_entry(config, project=project, action=WorkLogAction.NOTE, summary=f"n{i}",
+                      ts=start + timedelta(minutes=i))
+            if i % 7 == 0:
+                # Logged now, stamped with an older commit time
+                add_entry(config, project=project, action=WorkLogAction.COMMIT, commit_hash=f"c{i}",
+                          summary=f"commit{i}", ts=start + timedelta(minutes=i - 30))
+
+        full = read_entries(config)
+        for project in (None, "test", "other"):
+            expected = [e for e in full if project is None or e.project == project]
+            for limit in (1, 3, 20, 100):
+                got = read_entries(config, project=project, limit=limit)
+                assert [e.summary for e in got] == [e.summary for e in expected[:limit]]
+
+    def test_out_of_order_note_entry(self, temp_portfolio):
+        """A non-commit entry from a skewed clock does not hide newer ones."""
+        config = temp_portfolio["config"]
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for summary, minutes in (("X", 100), ("Y", 50), ("Z", 60), ("W", 61)):
+            add_entry(config, project="test", action=WorkLogAction.NOTE, summary=summary,
+                      ts=start + timedelta(minutes=minutes))
+
+        assert [e.summary for e in read_entries(config, limit=2)] == ["X", "W"]